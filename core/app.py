@@ -1,6 +1,6 @@
-import asyncio
 import importlib
 import logging
+import selectors
 import signal
 import socket
 import time
@@ -8,6 +8,7 @@ import sys
 import os
 
 import posix_ipc
+from PIL import Image, ImageDraw, ImageFont
 
 import settings
 from libs import epd
@@ -25,8 +26,10 @@ class App:
     calendar: Calendar = get_calendar()
     weather: Weather = get_weather()
     epd: EPD = get_epd()
-    async_loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
     loop_time: int = 0
+    _loading_bg: Image = None
+    _loading_font: ImageFont = None
+    _screen_index_by_name: dict = {}
 
     def current_screen(self):
         return self.screens[self.current_screen_index]
@@ -103,6 +106,7 @@ class App:
                 new_screen = screen_module.Screen()
                 self.screens.append(new_screen)
                 self.screen_modules.append(screen_module)
+                self._rebuild_screen_index()
                 self.logger.info(f"Successfully added screen '{screen_name}'")
             except AttributeError:
                 self.logger.error("Screen '{0}' has no Screen class".format(screen_name))
@@ -111,13 +115,18 @@ class App:
         else:
             self.logger.error("Failed to load screen module: {}".format(screen_name))
 
+    def _rebuild_screen_index(self):
+        """Rebuild the name-to-index lookup after the screens list changes."""
+        index_by_name = {}
+        for index, screen in enumerate(self.screens):
+            name = screen.__module__
+            index_by_name[name] = index
+            index_by_name[name.split('.')[-1]] = index
+        self._screen_index_by_name = index_by_name
+
     def find_screen_index_by_name(self, screen_name):
-        for index in range(0, len(self.screens)):
-            name = self.screens[index].__module__
-            if name == screen_name or name.split('.')[-1] == screen_name:
-                return index
         # Return -1 without logging - let the caller decide if this is an error
-        return -1
+        return self._screen_index_by_name.get(screen_name, -1)
 
     def get_screen_by_name(self, screen_name):
         index = self.find_screen_index_by_name(screen_name)
@@ -139,16 +148,18 @@ class App:
         """
         Show a loading message on the display during initialization
         """
-        from PIL import Image, ImageDraw, ImageFont
+        # Build the blank background and font once; only the message changes
+        # between calls, so redraw text on a copy of the cached template
+        if self._loading_bg is None:
+            self._loading_bg = Image.new('1', self.epd.get_size(), 255)  # White background
+            try:
+                self._loading_font = ImageFont.truetype(settings.FONT, 20)
+            except:
+                self._loading_font = ImageFont.load_default()
 
-        # Create a simple loading screen
-        img = Image.new('1', self.epd.get_size(), 255)  # White background
+        img = self._loading_bg.copy()
         draw = ImageDraw.Draw(img)
-
-        try:
-            font = ImageFont.truetype(settings.FONT, 20)
-        except:
-            font = ImageFont.load_default()
+        font = self._loading_font
 
         # Center the text
         bbox = draw.textbbox((0, 0), message, font=font)
@@ -264,6 +275,12 @@ class App:
         self.mq = posix_ipc.MessageQueue("/epdtext_ipc", flags=posix_ipc.O_CREAT)
         self.mq.block = False
 
+        # On Linux the queue descriptor is pollable, so the main loop can
+        # sleep in the kernel until a message actually arrives instead of
+        # waking up to poll the queue
+        self.selector = selectors.DefaultSelector()
+        self.selector.register(self.mq.mqd, selectors.EVENT_READ)
+
         # Wait for network before loading calendar/weather
         self._wait_for_network()
 
@@ -295,86 +312,110 @@ class App:
     def shutdown(self, *args):
         self.logger.info("epdtext shutting down gracefully...")
         self.epd.clear()
-        while len(self.screens) > 0:
-            del self.screens[0]
-
-        time.sleep(5)
+        self.screens.clear()
+        self.screen_modules.clear()
+        self._rebuild_screen_index()
 
-        self.epd.stop()
-        self.calendar.stop()
-        self.weather.stop()
+        # Give the display thread a moment to flush the final clear
+        time.sleep(2)
 
-        self.epd.join()
-        self.calendar.join()
-        self.weather.join()
+        # Signal all threads first, then join with a bound so the waits
+        # overlap and a stuck thread can't hang shutdown
+        workers = (self.epd, self.calendar, self.weather)
+        for worker in workers:
+            worker.stop()
+        for worker in workers:
+            worker.join(timeout=2)
 
         exit(0)
 
+    # Commands that are idempotent: replaying the same one within a burst
+    # only triggers extra e-paper refreshes, so consecutive duplicates
+    # can be collapsed when draining the queue
+    IDEMPOTENT_COMMANDS = ("reload", "screen")
+
     def process_message(self):
-        try:
-            message = self.mq.receive(timeout=10)
-        except posix_ipc.BusyError:
-            message = None
-
-        if message:
-            parts = message[0].decode().split()
-
-            command = parts[0]
-            self.logger.debug("Received IPC command: " + command)
-            if command == "button0":
-                self.handle_btn0_press()
-            elif command == "button3":
-                self.handle_btn3_press()
-            elif command == "button1":
-                self.handle_btn1_press()
-            elif command == "button2":
-                self.handle_btn2_press()
-            elif command == "previous":
-                self.previous_screen()
-            elif command == "next":
-                self.next_screen()
-            elif command == "reload":
-                self.current_screen().reload()
-                self.current_screen().show()
-            elif command == "screen":
-                self.logger.debug("Attempting switch to screen '{0}'".format(parts[1]))
-                self.current_screen_index = self.find_screen_index_by_name(parts[1])
-                if self.current_screen_index < 0:
-                    self.logger.error("Couldn't find screen '{0}'".format(parts[1]))
+        # Wait for a message to arrive; the 1 second timeout keeps the
+        # periodic screen tick alive when the queue stays quiet
+        if not self.selector.select(timeout=1.0):
+            return
+
+        # Drain any backlog in one pass so bursts (e.g. rapid button presses)
+        # don't queue up at one message per loop iteration
+        pending = []
+        while True:
+            try:
+                message = self.mq.receive(timeout=0)
+            except posix_ipc.BusyError:
+                break
+            pending.append(message[0].decode().split())
+
+        for index, parts in enumerate(pending):
+            # Collapse consecutive duplicates of idempotent commands
+            if (parts[0] in self.IDEMPOTENT_COMMANDS
+                    and index + 1 < len(pending) and pending[index + 1] == parts):
+                continue
+            self._dispatch_command(parts)
+
+    def _dispatch_command(self, parts):
+        command = parts[0]
+        self.logger.debug("Received IPC command: " + command)
+        if command == "button0":
+            self.handle_btn0_press()
+        elif command == "button3":
+            self.handle_btn3_press()
+        elif command == "button1":
+            self.handle_btn1_press()
+        elif command == "button2":
+            self.handle_btn2_press()
+        elif command == "previous":
+            self.previous_screen()
+        elif command == "next":
+            self.next_screen()
+        elif command == "reload":
+            self.current_screen().reload()
+            self.current_screen().show()
+        elif command == "screen":
+            self.logger.debug("Attempting switch to screen '{0}'".format(parts[1]))
+            self.current_screen_index = self.find_screen_index_by_name(parts[1])
+            if self.current_screen_index < 0:
+                self.logger.error("Couldn't find screen '{0}'".format(parts[1]))
+                self.current_screen_index = 0
+            self._save_current_screen_name()
+            self.current_screen().reload()
+            self.current_screen().show()
+        elif command == "remove_screen":
+            self.logger.debug("Attempting to remove screen '{0}'".format(parts[1]))
+            screen_to_remove = self.get_screen_by_name(parts[1])
+            module_to_remove = self.get_screen_module_by_name(parts[1])
+
+            if screen_to_remove and module_to_remove:
+                if self.current_screen_index == self.find_screen_index_by_name(parts[1]):
                     self.current_screen_index = 0
-                self._save_current_screen_name()
-                self.current_screen().reload()
-                self.current_screen().show()
-            elif command == "remove_screen":
-                self.logger.debug("Attempting to remove screen '{0}'".format(parts[1]))
-                screen_to_remove = self.get_screen_by_name(parts[1])
-                module_to_remove = self.get_screen_module_by_name(parts[1])
-
-                if screen_to_remove and module_to_remove:
-                    if self.current_screen_index == self.find_screen_index_by_name(parts[1]):
-                        self.current_screen_index = 0
-                        self.current_screen().reload()
-                    self.screens.remove(screen_to_remove)
-                    self.screen_modules.remove(module_to_remove)
-                    self.logger.info(f"Successfully removed screen '{parts[1]}'")
-                else:
-                    self.logger.error(f"Cannot remove screen '{parts[1]}': not found")
-            elif command == "add_screen":
-                self.logger.debug("Attempting to add screen '{0}'".format(parts[1]))
-                if self.get_screen_by_name(parts[1]):
-                    self.logger.error("Screen '{0}' already added".format(parts[1]))
-                else:
-                    self.add_screen(parts[1])
-
+                    self.current_screen().reload()
+                self.screens.remove(screen_to_remove)
+                self.screen_modules.remove(module_to_remove)
+                self._rebuild_screen_index()
+                self.logger.info(f"Successfully removed screen '{parts[1]}'")
+            else:
+                self.logger.error(f"Cannot remove screen '{parts[1]}': not found")
+        elif command == "add_screen":
+            self.logger.debug("Attempting to add screen '{0}'".format(parts[1]))
+            if self.get_screen_by_name(parts[1]):
+                self.logger.error("Screen '{0}' already added".format(parts[1]))
             else:
-                self.logger.error("Command '{0}' not recognized".format(command))
+                self.add_screen(parts[1])
+
+        else:
+            self.logger.error("Command '{0}' not recognized".format(command))
 
     def loop(self):
+        last_tick = time.monotonic()
+
         while True:
+            # Blocks up to 1s waiting for IPC, so no extra sleep is needed
             self.process_message()
 
-            time.sleep(1)
-
             # self.weather.refresh_interval -= 1
             # if self.weather.refresh_interval < 1:
             #     # asyncio.get_event_loop().run_until_complete(self.weather.update())
@@ -383,6 +424,13 @@ class App:
             #     self.current_screen().show()
             #     self.weather.refresh_interval = settings.WEATHER_REFRESH
 
+            # Run the periodic screen tick on a real 1-second cadence, even
+            # when messages arrive faster than the receive timeout
+            now = time.monotonic()
+            if now - last_tick < 1.0:
+                continue
+            last_tick = now
+
             self.current_screen().iterate_loop()
 
             if self.loop_time >= TIME:
@@ -1,6 +1,9 @@
+import random
+import socket
 import time
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date, datetime, timedelta
 from functools import wraps
 
@@ -23,43 +26,91 @@ INITIAL_RETRY_DELAY = 1  # seconds
 MAX_RETRY_DELAY = 60  # seconds
 
 
+# urllib3 >= 2 raises a dedicated exception for failed lookups; older
+# versions wrap socket.gaierror instead, which _is_dns_failure digs out
+_NAME_RESOLUTION_ERROR = getattr(urllib3.exceptions, 'NameResolutionError', None)
+
+# Errors that retrying can't fix: DNS NXDOMAIN (misconfigured URL) and
+# certificate mismatches. Fail fast instead of blocking for minutes.
+NON_RETRYABLE_EXCEPTIONS = (
+    requests.exceptions.SSLError,
+) + ((_NAME_RESOLUTION_ERROR,) if _NAME_RESOLUTION_ERROR else ())
+
+
+def _is_dns_failure(error):
+    """
+    Check whether an exception chain bottoms out in a name-resolution
+    failure. requests buries the gaierror under ConnectionError ->
+    MaxRetryError -> NewConnectionError, so walk .reason and the
+    implicit cause/context links.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, socket.gaierror):
+            return True
+        if _NAME_RESOLUTION_ERROR and isinstance(error, _NAME_RESOLUTION_ERROR):
+            return True
+        error = (getattr(error, 'reason', None)
+                 or error.__cause__ or error.__context__)
+    return False
+
+
 def retry_with_backoff(max_attempts=MAX_RETRY_ATTEMPTS, initial_delay=INITIAL_RETRY_DELAY, max_delay=MAX_RETRY_DELAY):
     """
-    Decorator for retrying functions with exponential backoff.
-    Retries on network-related exceptions only.
+    Decorator for retrying functions with exponential backoff and full jitter.
+    Retries on transient network exceptions only; DNS and certificate errors
+    are re-raised immediately.
     """
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
             attempt = 0
-            delay = initial_delay
+            cap = initial_delay
+
+            # When decorating Calendar methods, use the instance's shutdown
+            # event so a pending retry sleep can be interrupted on stop()
+            shutdown = getattr(args[0], 'shutdown', None) if args else None
 
             while attempt < max_attempts:
                 try:
                     return func(*args, **kwargs)
+                except NON_RETRYABLE_EXCEPTIONS as e:
+                    logger.error(f"{func.__name__} failed with non-retryable error: {e}")
+                    raise
                 except (
                     requests.exceptions.ConnectionError,
                     requests.exceptions.Timeout,
-                    requests.exceptions.SSLError,
                     urllib3.exceptions.NewConnectionError,
                     urllib3.exceptions.TimeoutError,
                     urllib3.exceptions.ProtocolError,
-                    httplib2.error.ServerNotFoundError,
                     httplib2.error.HttpLib2Error,
                     OSError,  # Socket errors
                     TimeoutError,
                 ) as e:
+                    # A failed lookup means a misconfigured URL (or no DNS
+                    # at all): retrying can't fix it, so fail fast here too
+                    if _is_dns_failure(e):
+                        logger.error(f"{func.__name__} failed with DNS resolution error: {e}")
+                        raise
                     attempt += 1
                     if attempt >= max_attempts:
                         logger.error(f"{func.__name__} failed after {max_attempts} attempts: {e}")
                         raise
 
-                    logger.warning(f"{func.__name__} failed (attempt {attempt}/{max_attempts}): {e}. "
-                                 f"Retrying in {delay}s...")
-                    time.sleep(delay)
+                    # Full jitter: sleep a random amount up to the exponential
+                    # cap so concurrent retries don't synchronize
+                    cap = min(cap * 2, max_delay)
+                    delay = random.uniform(0, cap)
 
-                    # Exponential backoff with jitter
-                    delay = min(delay * 2, max_delay)
+                    logger.warning(f"{func.__name__} failed (attempt {attempt}/{max_attempts}): {e}. "
+                                 f"Retrying in {delay:.1f}s...")
+                    if shutdown is not None:
+                        if shutdown.wait(delay):
+                            logger.info(f"{func.__name__} retry interrupted by shutdown")
+                            raise
+                    else:
+                        time.sleep(delay)
 
             return None
         return wrapper
@@ -72,6 +123,12 @@ CALENDAR_REFRESH = settings.CALENDAR_REFRESH
 timezone = pytz.timezone(TIMEZONE)
 logger = logging.getLogger('pitftmanager.libs.calendar')
 
+# Constants reused by sort_by_date so the fallback branches don't
+# recompute/allocate on every key extraction
+_MIDNIGHT = datetime.min.time()
+_TZ_MAX = timezone.localize(datetime.max)
+_NO_DUE_DATE = datetime.fromisocalendar(4000, 1, 1)
+
 
 def sort_by_date(obj: dict):
     """
@@ -81,20 +138,20 @@ def sort_by_date(obj: dict):
     """
     if obj.get("start"):
         if isinstance(obj["start"], date) and not isinstance(obj["start"], datetime):
-            return datetime.combine(obj["start"], datetime.min.time(), timezone)
+            return datetime.combine(obj["start"], _MIDNIGHT, timezone)
         if not obj["start"].tzinfo:
             return timezone.localize(obj["start"])
         return obj["start"]
     elif obj.get("due"):
         if not obj["due"]:
-            return datetime.fromisocalendar(4000, 1, 1)
+            return _NO_DUE_DATE
         if isinstance(obj["due"], date) and not isinstance(obj["due"], datetime):
-            return datetime.combine(obj["due"], datetime.min.time(), timezone)
+            return datetime.combine(obj["due"], _MIDNIGHT, timezone)
         if not obj["due"].tzinfo:
             return timezone.localize(obj["due"])
         return obj["due"]
     else:
-        return timezone.localize(datetime.max)
+        return _TZ_MAX
 
 
 class Calendar(threading.Thread):
@@ -105,7 +162,6 @@ class Calendar(threading.Thread):
     refresh_interval: int = CALENDAR_REFRESH
     events: list = []
     tasks: list = []
-    thread_lock: threading.Lock = threading.Lock()
 
     def __init__(self):
         """
@@ -116,6 +172,18 @@ class Calendar(threading.Thread):
         self.name = "Calendar"
         self.shutdown = threading.Event()
 
+        # Lazily built structure-of-arrays view of events for render loops;
+        # keyed on the identity of the published events list so it follows
+        # the atomic swap in get_latest_events
+        self._events_view = None
+
+        # Dispatch table for connection types; new providers register here
+        # instead of growing an if/elif chain in _fetch_connection
+        self._connection_handlers = {
+            'webcal': self._fetch_webcal_connection,
+            'caldav': self._fetch_caldav_connection,
+        }
+
     def run(self):
         thread_process = threading.Thread(target=self.calendar_loop)
         # run thread as a daemon so it gets cleaned up on exit.
@@ -150,23 +218,36 @@ class Calendar(threading.Thread):
             return arg
 
     @retry_with_backoff()
-    def _fetch_webcal_events(self, url):
+    def _download_ics(self, url):
         """
-        Fetch events from webcal URL with retry logic.
+        Download the raw .ics document for a webcal with retry logic.
         :param url: the URL of the webcal
+        :return: bytes of the .ics document
+        """
+        response = requests.get(url.replace('webcal://', 'https://'), timeout=10)
+        response.raise_for_status()
+        return response.content
+
+    def _fetch_webcal_events(self, url, now):
+        """
+        Fetch and parse events from a webcal URL. The download is separated
+        from the parse so only the network part sits behind retry logic.
+        :param url: the URL of the webcal
+        :param now: datetime the fetch window starts from
         :return: list of events
         """
-        return events(url, start=datetime.today(),
-                     end=datetime.today() + timedelta(days=14))
+        content = self._download_ics(url)
+        return events(string_content=content, start=now, end=now + timedelta(days=14))
 
-    def get_events_from_webcal(self, new_events, url):
+    def get_events_from_webcal(self, new_events, url, now):
         """
         Retrieve events from webcal and append them to the list
         :param new_events: list of new events
         :param url: the URL of the webcal
+        :param now: datetime the fetch window starts from
         """
         try:
-            timeline = self._fetch_webcal_events(url)
+            timeline = self._fetch_webcal_events(url, now)
             for event in timeline:
                 start = event.start
                 end = event.end if hasattr(event, 'end') else None
@@ -223,7 +304,7 @@ class Calendar(threading.Thread):
         """
         return calendar.todos()
 
-    def get_events_from_caldav(self, new_events, new_tasks, url, username, password):
+    def get_events_from_caldav(self, new_events, new_tasks, url, username, password, now):
         """
         Retrieve events and tasks from CalDAV
         :param new_events: list of new events
@@ -231,6 +312,7 @@ class Calendar(threading.Thread):
         :param url: URL of CalDAV server
         :param username: CalDAV user name
         :param password: CalDAV password
+        :param now: datetime the fetch window starts from
         :return: the list of events
         """
         try:
@@ -247,11 +329,17 @@ class Calendar(threading.Thread):
 
         for cal in calendars:
             try:
-                calendar_events = self._fetch_caldav_events(
-                    cal,
-                    start=datetime.today(),
-                    end=datetime.today() + timedelta(days=7)
-                )
+                # Issue the events and todos requests together so each
+                # calendar costs one round trip of wall time, not two
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    events_future = executor.submit(
+                        self._fetch_caldav_events, cal,
+                        start=now, end=now + timedelta(days=7)
+                    )
+                    todos_future = executor.submit(self._fetch_caldav_todos, cal)
+                    calendar_events = events_future.result()
+                    todos = todos_future.result()
+
                 for event in calendar_events:
                     start = self.standardize_date(event.vobject_instance.vevent.dtstart.value)
                     summary = event.vobject_instance.vevent.summary.value
@@ -268,8 +356,6 @@ class Calendar(threading.Thread):
                         'summary': summary
                     })
 
-                todos = self._fetch_caldav_todos(cal)
-
                 for todo in todos:
                     try:
                         due = self.standardize_date(todo.vobject_instance.vtodo.due.value)
@@ -286,74 +372,162 @@ class Calendar(threading.Thread):
                 logger.warning(f"Failed to process calendar in '{url}': {error}")
                 continue
 
+    def _fetch_webcal_connection(self, connection, conn_events, conn_tasks, now):
+        """
+        Handle one webcal connection from CALENDAR_URLS
+        """
+        try:
+            self.get_events_from_webcal(conn_events, connection["url"], now)
+        except KeyError as error:
+            logger.error("No URL specified for calendar")
+            logger.error(error)
+
+    def _fetch_caldav_connection(self, connection, conn_events, conn_tasks, now):
+        """
+        Handle one CalDAV connection from CALENDAR_URLS
+        """
+        try:
+            self.get_events_from_caldav(conn_events, conn_tasks, connection["url"],
+                                        connection["username"], connection["password"], now)
+        except KeyError as error:
+            if connection.get('url'):
+                logger.error("Error reading calendar: {}".format(connection['url']))
+            else:
+                logger.error("No URL specified for calendar")
+            logger.error(error)
+
+    def _fetch_connection(self, connection, now):
+        """
+        Fetch events and tasks from a single configured calendar source
+        :param connection: dict describing the calendar connection
+        :param now: datetime the fetch window starts from
+        :return: tuple of (events, tasks) lists for this source
+        """
+        conn_events = []
+        conn_tasks = []
+
+        handler = self._connection_handlers.get(str(connection["type"]).lower())
+        if handler:
+            handler(connection, conn_events, conn_tasks, now)
+        else:
+            logger.error("calendar type not recognized: {0}".format(str(connection["type"])))
+
+        return conn_events, conn_tasks
+
     def get_latest_events(self):
         """
         Update events and tasks
         """
         logger.debug("Started reading calendars...")
-        self.thread_lock.acquire()
+        # Compute the fetch window and cutoff once so the whole refresh uses
+        # a consistent notion of "today", even if it straddles midnight
+        now = datetime.today()
+        today = date.today()
         new_events = []
         new_tasks = []
 
-        for connection in CALENDAR_URLS:
-            if str(connection["type"]).lower() == 'webcal':
-                try:
-                    self.get_events_from_webcal(new_events, connection["url"])
-                except KeyError as error:
-                    logger.error("No URL specified for calendar")
-                    logger.error(error)
-            elif str(connection['type']).lower() == 'caldav':
-                try:
-                    self.get_events_from_caldav(new_events, new_tasks, connection["url"],
-                                                connection["username"], connection["password"])
-                except KeyError as error:
-                    if connection.get('url'):
-                        logger.error("Error reading calendar: {}".format(connection['url']))
-                    else:
-                        logger.error("No URL specified for calendar")
-                    logger.error(error)
-            else:
-                logger.error("calendar type not recognized: {0}".format(str(connection["type"])))
+        # Fetch all sources concurrently - the work is network-bound, so the
+        # total wall time becomes that of the slowest source instead of the sum
+        if CALENDAR_URLS:
+            with ThreadPoolExecutor(max_workers=len(CALENDAR_URLS)) as executor:
+                futures = [executor.submit(self._fetch_connection, connection, now)
+                           for connection in CALENDAR_URLS]
+                for future in as_completed(futures):
+                    conn_events, conn_tasks = future.result()
+                    new_events.extend(conn_events)
+                    new_tasks.extend(conn_tasks)
 
         # Filter out past events - keep only today and future
-        new_events = [e for e in new_events if e["start"].date() >= date.today()]
+        new_events = [e for e in new_events if e["start"].date() >= today]
 
         new_events.sort(key=sort_by_date)
         new_tasks.sort(key=sort_by_date)
 
         logger.debug("done!")
 
-        self.events = new_events
-        self.tasks = new_tasks
+        # Publish via atomic reference swap: readers either see the old
+        # snapshot or the new one, never a partially built list, so no lock
+        # is needed
+        self.events, self.tasks = new_events, new_tasks
 
-        self.thread_lock.release()
+    def events_view(self):
+        """
+        Get the current events as parallel arrays of pre-derived fields, so
+        render loops iterate plain lists instead of doing per-event dict
+        lookups and datetime conversions on every redraw
+        :return: tuple of (starts, ends, date_texts, titles) lists
+        """
+        cached = self._events_view
+        if cached is not None and cached[0] is self.events:
+            return cached[1]
+
+        source = self.events
+        starts = []
+        ends = []
+        date_texts = []
+        titles = []
+
+        for event in source:
+            start = self.standardize_date(event["start"])
+            end = self.standardize_date(event["end"]) if event.get("end") else None
+
+            # Humanized date plus time range, unless it's an all-day event
+            date_text = self.humanized_datetime(start)
+            if end is not None:
+                is_all_day = (start.hour == 0 and start.minute == 0 and
+                              end.hour == 0 and end.minute == 0)
+                if not is_all_day:
+                    date_text += f" {start.strftime('%H:%M')}-{end.strftime('%H:%M')}"
+
+            starts.append(start)
+            ends.append(end)
+            date_texts.append(date_text)
+            titles.append(str(event["summary"]).replace('\n', ' ').strip())
+
+        columns = (starts, ends, date_texts, titles)
+        self._events_view = (source, columns)
+        return columns
 
     def events_as_string(self):
         """
         Get the current events as a string
         :return: list of events
         """
-        text = ''
+        lines = []
 
         for obj in self.events:
-            text += self.humanized_datetime(obj["start"]) + '\n'
-            text += obj["summary"].replace('\n', ' ') + '\n'
-
-        return text
+            # Humanize once per event; the cached value lives on the dict
+            # and is rebuilt with it at the next calendar refresh
+            humanized = obj.get('_humanized_start')
+            if humanized is None:
+                humanized = self.humanized_datetime(obj["start"])
+                obj['_humanized_start'] = humanized
+            lines.append(humanized)
+            lines.append(obj["summary"].replace('\n', ' '))
+
+        if not lines:
+            return ''
+        return '\n'.join(lines) + '\n'
 
     def tasks_as_string(self):
         """
         Get the current tasks as a string
         :return: list of tasks
         """
-        text = ''
+        lines = []
 
         for obj in self.tasks:
-            text += "* " + obj["summary"].replace('\n', ' ') + '\n'
+            lines.append("* " + obj["summary"].replace('\n', ' '))
             if obj["due"]:
-                text += "  - Due: " + self.humanized_datetime(obj["due"]) + "\n"
-
-        return text
+                humanized = obj.get('_humanized_due')
+                if humanized is None:
+                    humanized = self.humanized_datetime(obj["due"])
+                    obj['_humanized_due'] = humanized
+                lines.append("  - Due: " + humanized)
+
+        if not lines:
+            return ''
+        return '\n'.join(lines) + '\n'
 
     def humanized_datetime(self, dt: datetime):
         """
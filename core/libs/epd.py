@@ -1,3 +1,4 @@
+import hashlib
 import importlib
 import time
 import logging
@@ -24,6 +25,7 @@ class EPD(threading.Thread):
     epd: driver.EPD = driver.EPD()
     dirty: bool = False
     image: Image = Image.new("1", (driver.EPD_HEIGHT, driver.EPD_WIDTH), 255)
+    last_frame_hash: bytes = None
     thread_lock = threading.Lock()
     shutdown = threading.Event()
 
@@ -75,9 +77,18 @@ class EPD(threading.Thread):
 
     def show(self, image: Image):
         """
-        Draws an image to the image buffer
+        Draws an image to the image buffer, skipping the refresh entirely
+        if the frame is identical to the one already on the display
         :param image: image to be displayed
         """
+        # tobytes() on a 1-bit image is the packed framebuffer, so hashing it
+        # is a cheap way to detect frames that wouldn't change any pixel
+        frame_hash = hashlib.blake2b(image.tobytes(), digest_size=16).digest()
+        if frame_hash == self.last_frame_hash:
+            logger.debug("Image unchanged, skipping EPD refresh")
+            return
+        self.last_frame_hash = frame_hash
+
         logger.debug("Image sent to EPD")
         self.image = image
         self.dirty = True
@@ -1,16 +1,106 @@
+import functools
 import os
 import sys
 import logging
-from io import BytesIO
-from PIL import Image
-import cairosvg
-
+import xml.etree.ElementTree as ElementTree
 # Import Met.no provider from waveshare
 # Import from weather_providers package
 from libs.weather_providers.metno import MetNo
 
 logger = logging.getLogger(__name__)
 
+# Size pre-rendered on every weather refresh (dashboard icon size)
+DEFAULT_ICON_SIZE = 50
+
+# On-disk layer for rendered icons (cache/ is gitignored); decoding a
+# pre-rendered PNG is far cheaper than a cairosvg rasterization and the
+# cache survives restarts
+_ICON_CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'cache', 'icons'
+)
+
+_SVG_NS = 'http://www.w3.org/2000/svg'
+
+# Keep the default namespace unprefixed when serializing icons back to bytes
+ElementTree.register_namespace('', _SVG_NS)
+
+
+@functools.lru_cache(maxsize=64)
+def _render_icon(svg_path, size):
+    """
+    Render an SVG icon file to a 1-bit PIL Image, cached by (path, size).
+
+    The icon set is small and stable, so caching the rasterized result
+    avoids re-running CairoSVG on every screen redraw.
+
+    Args:
+        svg_path: Absolute path to the SVG icon file
+        size: Target size in pixels
+
+    Returns:
+        PIL Image (1-bit, black/white)
+    """
+    # PIL and Cairo are only needed once an icon is actually rendered;
+    # importing here keeps them off the module-load path (they pull in
+    # large shared libraries, a noticeable cold-start cost on a Pi)
+    from PIL import Image
+
+    # Disk hit: reuse the pre-rendered PNG unless the SVG is newer
+    icon_code = os.path.splitext(os.path.basename(svg_path))[0]
+    cached_png = os.path.join(_ICON_CACHE_DIR, f"{icon_code}_{size}.png")
+    try:
+        if os.path.getmtime(cached_png) >= os.path.getmtime(svg_path):
+            img = Image.open(cached_png).convert('1')
+            img.load()
+            return img
+    except OSError:
+        pass
+
+    from cairosvg.parser import Tree
+    from cairosvg.surface import PNGSurface
+
+    # Parse the icon once and retarget its root attributes instead of
+    # regex-stripping the markup and rebuilding a wrapper string
+    root = ElementTree.parse(svg_path).getroot()
+    root.set('width', str(size))
+    root.set('height', str(size))
+    # Icons are drawn in a 130x130 coordinate system
+    root.set('viewBox', '0 0 130 130')
+
+    # White background behind the icon for the 1-bit display
+    background = ElementTree.Element(
+        f'{{{_SVG_NS}}}rect',
+        {'width': '130', 'height': '130', 'fill': 'white'}
+    )
+    root.insert(0, background)
+
+    # Render straight onto a Cairo ARGB32 surface and read the raw pixels,
+    # skipping the PNG encode + zlib + PIL decode round-trip entirely
+    tree = Tree(bytestring=ElementTree.tostring(root))
+    surface = PNGSurface(tree, None, 96, output_width=size, output_height=size)
+    cairo_surface = surface.cairo
+    cairo_surface.flush()
+
+    img = Image.frombuffer(
+        'RGBA',
+        (cairo_surface.get_width(), cairo_surface.get_height()),
+        bytes(cairo_surface.get_data()),
+        'raw', 'BGRa', cairo_surface.get_stride(), 1
+    )
+
+    # Convert to 1-bit for e-paper display
+    img = img.convert('1')
+
+    # Persist for the next cold start; failure to write is non-fatal
+    try:
+        os.makedirs(_ICON_CACHE_DIR, exist_ok=True)
+        img.save(cached_png)
+    except OSError as e:
+        logger.debug(f"Could not write icon cache {cached_png}: {e}")
+
+    return img
+
 class MetnoAdapter:
     """Adapter to use Met.no provider from waveshare in paperGate"""
 
@@ -32,6 +122,8 @@ class MetnoAdapter:
         )
 
         self.weather_data = None
+        self.icon_img = None
+        self.icon_size = None
         logger.info(f"Met.no adapter initialized with User-Agent: {self.user_agent}")
 
     def fetch_weather(self):
@@ -40,12 +132,43 @@ class MetnoAdapter:
             # Met.no provider returns dict:
             # {"temperatureMin": "2.0", "temperatureMax": "15.1",
             #  "icon": "mostly_cloudy", "description": "Cloudy"}
-            self.weather_data = self.provider.get_weather()
+            new_data = self.provider.get_weather()
+
+            # Pre-render the icon for the new snapshot, once per refresh,
+            # so screen draws only pay a paste instead of a rasterization
+            icon_img = None
+            svg_path = self._icon_svg_path(new_data.get('icon'))
+            if svg_path and os.path.exists(svg_path):
+                try:
+                    icon_img = _render_icon(svg_path, DEFAULT_ICON_SIZE).copy()
+                except Exception as e:
+                    logger.error(f"Failed to render SVG icon: {e}")
+
+            # Publish last: each store is atomic under the GIL, and readers
+            # go through weather_data first, so no torn snapshot is visible
+            self.icon_img = icon_img
+            self.icon_size = DEFAULT_ICON_SIZE if icon_img else None
+            self.weather_data = new_data
             return True
         except Exception as e:
             logger.error(f"Failed to fetch Met.no weather: {e}")
             return False
 
+    def get_cached_icon(self, size=DEFAULT_ICON_SIZE):
+        """
+        Get the icon pre-rendered at the last weather refresh, falling back
+        to a live render when a different size is requested
+
+        Args:
+            size: Target size in pixels (default 50)
+
+        Returns:
+            PIL Image (1-bit, black/white) or None
+        """
+        if self.icon_img is not None and size == self.icon_size:
+            return self.icon_img.copy()
+        return self.render_icon_to_image(size)
+
     def get_temperature(self):
         """Get current instantaneous temperature"""
         if not self.weather_data:
@@ -76,7 +199,11 @@ class MetnoAdapter:
 
     def get_icon_svg_path(self):
         """Get full path to SVG icon file"""
-        icon_name = self.get_icon_name()
+        return self._icon_svg_path(self.get_icon_name())
+
+    @staticmethod
+    def _icon_svg_path(icon_name):
+        """Resolve an icon name to its SVG file path"""
         if not icon_name:
             return None
 
@@ -111,46 +238,9 @@ class MetnoAdapter:
             return None
 
         try:
-            # Read the icon SVG content
-            with open(svg_path, 'r') as f:
-                icon_svg_content = f.read()
-
-            # Extract the inner content (remove <?xml...> and outer <svg> tags if present)
-            # We'll embed it directly in our wrapper
-            import re
-            # Remove XML declaration
-            icon_svg_content = re.sub(r'<\?xml[^>]*\?>', '', icon_svg_content)
-            # Extract content between <svg> tags or use as-is
-            svg_match = re.search(r'<svg[^>]*>(.*)</svg>', icon_svg_content, re.DOTALL)
-            if svg_match:
-                icon_inner = svg_match.group(1)
-            else:
-                icon_inner = icon_svg_content
-
-            # Create SVG wrapper with embedded icon content
-            # Use viewBox to automatically scale the icon to fit
-            svg_wrapper = f'''<?xml version="1.0" encoding="UTF-8" standalone="no"?>
-<svg xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"
-     width="{size}" height="{size}" viewBox="0 0 130 130">
-    <rect width="130" height="130" fill="white" />
-    {icon_inner}
-</svg>'''
-
-            # Render SVG wrapper to PNG in memory
-            png_data = cairosvg.svg2png(
-                bytestring=svg_wrapper.encode('utf-8'),
-                output_width=size,
-                output_height=size
-            )
-
-            # Convert to PIL Image
-            img = Image.open(BytesIO(png_data))
-
-            # Convert to 1-bit for e-paper display
-            img = img.convert('1')
-
-            return img
-
+            # Cached render: only the first (path, size) combination pays the
+            # CairoSVG cost. Return a copy so callers can't mutate the cache.
+            return _render_icon(svg_path, size).copy()
         except Exception as e:
             logger.error(f"Failed to render SVG icon: {e}")
             return None
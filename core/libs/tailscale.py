@@ -1,17 +1,33 @@
+import heapq
 import json
 import logging
+import re
 import socket
 import subprocess
+import threading
+import time
 import sys
 import os
-import psutil
 
-# Add parent directory to path for standalone execution
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# orjson parses the multi-KB status blob noticeably faster than stdlib json;
+# fall back transparently when it isn't installed.
+#
+# A lazy SIMD parser (pysimdjson) was also evaluated for large tailnets and
+# rejected: the status is parsed once per cache generation and then served
+# from _status_cache, so lazy field materialization saves almost nothing
+# here, while simdjson's reused tape buffer would invalidate the cached
+# document on the next parse.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Lazy load NETWORK_INTERFACE to avoid circular imports
 _NETWORK_INTERFACE = None
 
+# Matches: NETWORK_INTERFACE='eth0' or NETWORK_INTERFACE="eth0"
+_NETWORK_INTERFACE_RE = re.compile(rb'^\s*NETWORK_INTERFACE\s*=\s*[\'"]([^\'"]+)[\'"]', re.M)
+
 def get_network_interface():
     global _NETWORK_INTERFACE
     if _NETWORK_INTERFACE is None:
@@ -22,20 +38,12 @@ def get_network_interface():
                 os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
                 "local_settings.py"
             )
+            _NETWORK_INTERFACE = 'wlan0'
             if os.path.exists(local_settings_path):
-                with open(local_settings_path, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line.startswith('NETWORK_INTERFACE'):
-                            # Parse: NETWORK_INTERFACE='eth0' or NETWORK_INTERFACE="eth0"
-                            if '=' in line:
-                                value = line.split('=', 1)[1].strip()
-                                # Remove quotes
-                                value = value.strip('\'"')
-                                _NETWORK_INTERFACE = value
-                                break
-            if _NETWORK_INTERFACE is None:
-                _NETWORK_INTERFACE = 'wlan0'
+                with open(local_settings_path, 'rb') as f:
+                    match = _NETWORK_INTERFACE_RE.search(f.read())
+                if match:
+                    _NETWORK_INTERFACE = match.group(1).decode()
         except Exception as e:
             logger.debug(f"Could not load NETWORK_INTERFACE from local_settings: {e}")
             _NETWORK_INTERFACE = 'wlan0'
@@ -44,6 +52,19 @@ def get_network_interface():
 
 logger = logging.getLogger('epdtext.libs.tailscale')
 
+# How long a status snapshot is served without triggering a refresh
+STATUS_TTL = 10  # seconds
+
+# The local IP changes rarely; cache the interface scan briefly so dashboard
+# polls don't re-read /proc several times per refresh
+_LOCAL_IP_TTL = 30  # seconds
+_local_ip_cache = None  # (monotonic timestamp, value)
+
+# psutil is only needed for the interface scan in local_ip, but its import
+# opens /proc and loads a C extension - noticeable on a Pi. Defer it so
+# importing this module stays cheap when the Tailscale screen isn't shown.
+_psutil = None
+
 
 class Tailscale:
     """
@@ -52,31 +73,79 @@ class Tailscale:
 
     def __init__(self):
         self._status_cache = None
+        self._status_ts = 0.0
         self._cache_valid = False
+        self._peers_derived = None
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
 
     def _get_status(self):
         """
-        Get Tailscale status from tailscale CLI
+        Get Tailscale status, stale-while-revalidate style: fresh data is
+        served from cache, stale data is served immediately while a
+        background thread refreshes it, and only the very first call (no
+        snapshot at all) blocks on the tailscale CLI
         Returns parsed JSON or None if error
         """
-        if self._cache_valid and self._status_cache:
+        if self._status_cache is not None:
+            if self._cache_valid and time.monotonic() - self._status_ts < STATUS_TTL:
+                return self._status_cache
+            # Stale: hand back the old snapshot and refresh off-thread so
+            # the render loop never waits on the subprocess
+            self._start_background_refresh()
             return self._status_cache
 
+        return self._run_status_refresh()
+
+    def _start_background_refresh(self):
+        """
+        Kick off one background status refresh if none is already running
+        """
+        with self._refresh_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, daemon=True).start()
+
+    def _background_refresh(self):
         try:
-            result = subprocess.run(
+            self._run_status_refresh()
+        finally:
+            with self._refresh_lock:
+                self._refreshing = False
+
+    def _run_status_refresh(self):
+        """
+        Run the tailscale CLI and swap the fresh status into the cache
+        Returns parsed JSON or None if error
+        """
+        try:
+            # Popen + communicate keeps the output as raw bytes (both
+            # parsers accept them directly) and skips subprocess.run's
+            # CompletedProcess plumbing on this hot-ish path
+            process = subprocess.Popen(
                 ['tailscale', 'status', '--json'],
-                capture_output=True,
-                text=True,
-                timeout=5
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                close_fds=True
             )
-            if result.returncode == 0:
-                self._status_cache = json.loads(result.stdout)
+            stdout, stderr = process.communicate(timeout=5)
+            if process.returncode == 0:
+                if orjson is not None:
+                    status = orjson.loads(stdout)
+                else:
+                    status = json.loads(stdout)
+                self._status_cache = status
+                self._status_ts = time.monotonic()
                 self._cache_valid = True
-                return self._status_cache
+                self._peers_derived = None
+                return status
             else:
-                logger.error(f"tailscale status failed: {result.stderr}")
+                logger.error(f"tailscale status failed: {stderr.decode(errors='replace')}")
                 return None
         except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
             logger.error("tailscale status timed out")
             return None
         except FileNotFoundError:
@@ -93,7 +162,10 @@ class Tailscale:
         """
         Invalidate the status cache to force refresh on next access
         """
+        global _local_ip_cache
         self._cache_valid = False
+        self._peers_derived = None
+        _local_ip_cache = None
 
     @property
     def is_connected(self):
@@ -117,9 +189,15 @@ class Tailscale:
             return None
 
         ips = status.get('TailscaleIPs', [])
-        # Return the first IPv4 address (non-IPv6)
+        # Return the first IPv4 address: Tailscale hands out the CGNAT
+        # 100.64.0.0/10 range, so a prefix check (one memcmp) beats
+        # scanning the whole string for a colon
+        for ip in ips:
+            if ip.startswith('100.'):
+                return ip
+        # Fall back to the generic check in case of unusual addressing
         for ip in ips:
-            if ':' not in ip:  # Simple check for IPv4
+            if ':' not in ip:
                 return ip
         return None
 
@@ -128,13 +206,24 @@ class Tailscale:
         """
         Get the local network IPv4 address
         """
+        global _local_ip_cache
+
+        global _psutil
+
+        now = time.monotonic()
+        if _local_ip_cache and now - _local_ip_cache[0] < _LOCAL_IP_TTL:
+            return _local_ip_cache[1]
+
         try:
-            network_interface = get_network_interface()
-            for interface_name, interface_addresses in psutil.net_if_addrs().items():
-                for address in interface_addresses:
-                    if interface_name == network_interface and address.family == socket.AF_INET:
-                        return address.address
-            return None
+            if _psutil is None:
+                import psutil as _psutil
+            # Look the configured interface up directly instead of walking
+            # the full interfaces x addresses cross-product
+            addresses = _psutil.net_if_addrs().get(get_network_interface(), [])
+            value = next((address.address for address in addresses
+                          if address.family == socket.AF_INET), None)
+            _local_ip_cache = (now, value)
+            return value
         except Exception as e:
             logger.error(f"Error getting local IP: {e}")
             return None
@@ -182,24 +271,33 @@ class Tailscale:
         else:
             return "Disabled"
 
-    @property
-    def peers_online(self):
+    def _peers(self):
         """
-        Count number of online peers
+        Walk the peer table once and cache the derived values for the
+        lifetime of the current status cache
+        Returns: tuple of (online peer count, up to 9 sorted hostnames)
         """
+        if self._peers_derived is not None:
+            return self._peers_derived
+
         status = self._get_status()
         if not status:
-            return 0
+            return 0, []
 
-        peer_status = status.get('Peer', {})
-        online_count = 0
+        online_names = [peer_data.get('HostName', 'unknown')
+                        for peer_data in status.get('Peer', {}).values()
+                        if peer_data.get('Online', False)]
 
-        for peer_id, peer_data in peer_status.items():
-            # Check if peer is online (has recent activity)
-            if peer_data.get('Online', False):
-                online_count += 1
+        # Top 9 alphabetically without sorting the whole list
+        self._peers_derived = (len(online_names), heapq.nsmallest(9, online_names))
+        return self._peers_derived
 
-        return online_count
+    @property
+    def peers_online(self):
+        """
+        Count number of online peers
+        """
+        return self._peers()[0]
 
     @property
     def peer_names(self):
@@ -207,22 +305,7 @@ class Tailscale:
         Get list of online peer hostnames
         Returns: List of peer hostnames (up to 9)
         """
-        status = self._get_status()
-        if not status:
-            return []
-
-        peer_status = status.get('Peer', {})
-        peer_list = []
-
-        for peer_id, peer_data in peer_status.items():
-            # Check if peer is online
-            if peer_data.get('Online', False):
-                hostname = peer_data.get('HostName', 'unknown')
-                peer_list.append(hostname)
-
-        # Sort alphabetically and limit to 9
-        peer_list.sort()
-        return peer_list[:9]
+        return self._peers()[1]
 
     @property
     def backend_state(self):
@@ -248,6 +331,10 @@ def get_tailscale():
 
 
 if __name__ == '__main__':
+    # Add parent directory to path for standalone execution; kept out of
+    # the import path so normal imports don't lengthen sys.path
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
     logging.basicConfig(level=logging.DEBUG)
     ts = get_tailscale()
 
@@ -1,3 +1,4 @@
+import re
 import threading
 import time
 import logging
@@ -18,23 +19,83 @@ WEATHER_REFRESH = getattr(settings, 'WEATHER_REFRESH', 900)
 
 logger = logging.getLogger("pitftmanager.libs.weather")
 
+# Rendered temperature strings, keyed by the rounded value: the plausible
+# range is a few dozen entries, and reloads re-request the same handful
+_temp_text_cache = {}
+
+
+def format_temperature(temp):
+    """
+    Format a temperature as a display string ("21°"), memoized
+    :param temp: numeric temperature, or "--"/None when unavailable
+    :return: str
+    """
+    if temp is None or temp == "--":
+        return "--"
+    key = int(round(temp))
+    text = _temp_text_cache.get(key)
+    if text is None:
+        text = f"{key}°"
+        _temp_text_cache[key] = text
+    return text
+
+
+# Map weather description keywords to fallback PNG icons
+# (order matters - more specific first)
+_FALLBACK_ICON_MAP = [
+    ('thunder', os.path.join(IMAGES_DIR, 'thunderstorm.png')),
+    ('storm', os.path.join(IMAGES_DIR, 'thunderstorm.png')),
+    ('drizzle', os.path.join(IMAGES_DIR, 'drizzle.png')),
+    ('rain', os.path.join(IMAGES_DIR, 'rain.png')),
+    ('shower', os.path.join(IMAGES_DIR, 'rain.png')),
+    ('snow', os.path.join(IMAGES_DIR, 'snow.png')),
+    ('sleet', os.path.join(IMAGES_DIR, 'snow.png')),
+    ('fog', os.path.join(IMAGES_DIR, 'fog.png')),
+    ('mist', os.path.join(IMAGES_DIR, 'fog.png')),
+    ('haze', os.path.join(IMAGES_DIR, 'fog.png')),
+    ('clear', os.path.join(IMAGES_DIR, 'sun.png')),
+    ('fair', os.path.join(IMAGES_DIR, 'cloud_sun.png')),
+    ('partly', os.path.join(IMAGES_DIR, 'cloud_sun.png')),
+    ('cloudy', os.path.join(IMAGES_DIR, 'cloud.png')),
+    ('overcast', os.path.join(IMAGES_DIR, 'cloud.png')),
+]
+_DEFAULT_FALLBACK_ICON = os.path.join(IMAGES_DIR, 'cloud.png')
+
+# One C-level scan finds every keyword present; the priority order of
+# _FALLBACK_ICON_MAP then decides which one wins
+_FALLBACK_ICON_RE = re.compile('|'.join(re.escape(keyword)
+                                        for keyword, _ in _FALLBACK_ICON_MAP))
+
+# Decoded 1-bit fallback images, keyed by path
+_fallback_image_cache = {}
+
 
 class Weather(threading.Thread):
     """
     This class provides access to the weather info using Met.no provider
     """
-    refresh_interval: int = WEATHER_REFRESH
-    thread_lock = threading.Lock()
 
     def __init__(self):
         super().__init__()
         self.name = "Weather"
         self.shutdown = threading.Event()
+        # Set to request an immediate refresh instead of waiting out the timer
+        self.wake = threading.Event()
 
         # Initialize Met.no adapter with contact email for Terms of Service compliance
         self.metno = MetnoAdapter(WEATHER_LATITUDE, WEATHER_LONGITUDE, WEATHER_CONTACT_EMAIL)
         self.weather_data = None
 
+        # Last fallback lookup, keyed by the raw description string: while
+        # the weather is unchanged the whole keyword scan short-circuits to
+        # one string comparison
+        self._last_fallback_desc = None
+        self._last_fallback_icon = None
+
+        # Cached dashboard panel: (key, Image), rebuilt when the weather
+        # snapshot or requested geometry changes
+        self._panel = None
+
     def run(self) -> None:
         logger.debug('Weather loop starting...')
         thread_process = threading.Thread(target=self.weather_loop)
@@ -45,33 +106,35 @@ class Weather(threading.Thread):
 
     def weather_loop(self):
         while not self.shutdown.is_set():
-            self.refresh_interval -= 1
-            time.sleep(1)
-            if self.refresh_interval < 1:
-                try:
-                    self.update()
-                except Exception as error:
-                    logger.warning(f"Weather update error: {error}")
-                self.refresh_interval = WEATHER_REFRESH
+            # One timed wait per refresh period; wake fires early when an
+            # immediate update is requested, stop() interrupts it entirely
+            self.wake.clear()
+            self.wake.wait(timeout=WEATHER_REFRESH)
+            if self.shutdown.is_set():
+                break
+            try:
+                self.update()
+            except Exception as error:
+                logger.warning(f"Weather update error: {error}")
 
     def stop(self):
         self.shutdown.set()
+        self.wake.set()
 
     def update(self):
         """
         Update the weather info from Met.no
         :return: None
         """
-        self.thread_lock.acquire()
-        try:
-            success = self.metno.fetch_weather()
-            if success:
-                self.weather_data = self.metno.weather_data
-                logger.debug('Weather updated successfully from Met.no')
-            else:
-                logger.error('Failed to fetch weather from Met.no')
-        finally:
-            self.thread_lock.release()
+        # No lock: the adapter builds the new snapshot off to the side and
+        # publishes it with plain attribute stores, which are atomic under
+        # the GIL. Readers either see the old snapshot or the new one.
+        success = self.metno.fetch_weather()
+        if success:
+            self.weather_data = self.metno.weather_data
+            logger.debug('Weather updated successfully from Met.no')
+        else:
+            logger.error('Failed to fetch weather from Met.no')
 
     def get_temperature(self):
         """
@@ -145,25 +208,31 @@ class Weather(threading.Thread):
         Get the SVG weather icon rendered as PIL Image
         :param size: Size of the icon in pixels (default 50)
         :return: PIL Image or None
+
+        Repeated rasterization of the same icon is already amortized: the
+        adapter keeps an LRU of rendered 1-bit tiles keyed by (path, size)
+        and callers get copies, so this stays cheap at any refresh rate.
         """
         if not self.weather_data:
             return None
 
         try:
-            # Use Met.no adapter to render SVG icon
-            img = self.metno.render_icon_to_image(size)
+            # Icon is pre-rendered at each weather refresh; this is a copy
+            # of the cached image unless an unusual size is requested
+            img = self.metno.get_cached_icon(size)
             if img:
                 return img
             else:
                 logger.warning("Met.no icon render failed, using fallback")
-                return self._get_fallback_icon()
+                return self._get_fallback_icon(size)
         except Exception as e:
             logger.error(f"Could not render SVG icon: {e}")
-            return self._get_fallback_icon()
+            return self._get_fallback_icon(size)
 
-    def _get_fallback_icon(self):
+    def _get_fallback_icon(self, size=50):
         """
         Fallback to basic PNG icons if SVG rendering fails
+        :param size: Size of the icon in pixels (default 50)
         :return: PIL Image or None
         """
         if not self.weather_data:
@@ -174,45 +243,116 @@ class Weather(threading.Thread):
         if not description:
             return None
         
-        description_lower = description.lower()
+        if (description, size) == self._last_fallback_desc:
+            icon = self._last_fallback_icon
+            return icon.copy() if icon is not None else None
 
-        # Map weather descriptions to icon files (order matters - more specific first)
-        icon_map = {
-            'thunder': os.path.join(IMAGES_DIR, 'thunderstorm.png'),
-            'storm': os.path.join(IMAGES_DIR, 'thunderstorm.png'),
-            'drizzle': os.path.join(IMAGES_DIR, 'drizzle.png'),
-            'rain': os.path.join(IMAGES_DIR, 'rain.png'),
-            'shower': os.path.join(IMAGES_DIR, 'rain.png'),
-            'snow': os.path.join(IMAGES_DIR, 'snow.png'),
-            'sleet': os.path.join(IMAGES_DIR, 'snow.png'),
-            'fog': os.path.join(IMAGES_DIR, 'fog.png'),
-            'mist': os.path.join(IMAGES_DIR, 'fog.png'),
-            'haze': os.path.join(IMAGES_DIR, 'fog.png'),
-            'clear': os.path.join(IMAGES_DIR, 'sun.png'),
-            'fair': os.path.join(IMAGES_DIR, 'cloud_sun.png'),
-            'partly': os.path.join(IMAGES_DIR, 'cloud_sun.png'),
-            'cloudy': os.path.join(IMAGES_DIR, 'cloud.png'),
-            'overcast': os.path.join(IMAGES_DIR, 'cloud.png'),
-        }
-
-        # Find matching icon
-        icon_path = None
-        for key, path in icon_map.items():
-            if key in description_lower:
-                icon_path = path
-                break
+        description_lower = description.lower()
 
-        # Default to cloud if no match
-        if not icon_path:
-            icon_path = os.path.join(IMAGES_DIR, 'cloud.png')
+        # Find matching icon: single regex scan, then priority order decides
+        found = set(_FALLBACK_ICON_RE.findall(description_lower))
+        icon_path = next((path for keyword, path in _FALLBACK_ICON_MAP
+                          if keyword in found), _DEFAULT_FALLBACK_ICON)
+
+        # Cache the decoded, display-ready image by (path, size): the
+        # paste then blits a 1-bit tile at the exact target size instead
+        # of re-decoding, resizing and dithering per reload
+        img = _fallback_image_cache.get((icon_path, size))
+        if img is None:
+            try:
+                img = Image.open(icon_path).convert('L')
+                if img.size != (size, size):
+                    img = img.resize((size, size))
+                img = img.convert('1')
+                _fallback_image_cache[(icon_path, size)] = img
+            except Exception as e:
+                logger.error(f"Could not load weather icon {icon_path}: {e}")
+                return None
+
+        self._last_fallback_desc = (description, size)
+        self._last_fallback_icon = img
+        return img.copy()
+
+    def invalidate_panel(self):
+        """
+        Drop the cached dashboard panel so the next render rebuilds it
+        :return: None
+        """
+        self._panel = None
 
-        try:
-            img = Image.open(icon_path)
-            # Convert to 1-bit for e-paper
-            return img.convert('1')
-        except Exception as e:
-            logger.error(f"Could not load weather icon {icon_path}: {e}")
-            return None
+    def render_panel(self, width=88, height=126):
+        """
+        Render the dashboard weather panel (icon, temperature, description)
+        into a cached 1-bit image. The weather changes far less often than
+        the dashboard's minute tick, so the panel is built once per
+        snapshot and pasted thereafter.
+        :param width: panel width in pixels
+        :param height: panel height in pixels
+        :return: PIL Image (1-bit)
+        """
+        # Hold the snapshot dict itself and compare identity (same
+        # pattern as Calendar.events_view): keying on id() alone could
+        # false-hit if a later snapshot reuses a freed dict's address
+        snapshot = self.weather_data
+        if (self._panel is not None
+                and self._panel[0] is snapshot
+                and self._panel[1] == (width, height)):
+            return self._panel[2]
+
+        # Imported lazily to keep libs importable without the screens
+        # package (e.g. when run standalone)
+        from PIL import ImageDraw
+        from screens._fontcache import get_font, get_text_width
+
+        panel = Image.new('1', (width, height), 255)
+        draw = ImageDraw.Draw(panel)
+
+        # Weather icon, centered, at the top of the panel
+        icon_size = 50
+        icon_y = 10
+        icon_image = self.get_icon_image(size=icon_size)
+        if icon_image:
+            panel.paste(icon_image, ((width - icon_size) // 2, icon_y))
+
+        # Current temperature below the icon (bold, centered)
+        temp = self.get_temperature()
+        temp_text = format_temperature(temp)
+        temp_width = get_text_width(settings.BOLD_FONT, 18, temp_text)
+        temp_y = icon_y + icon_size + 3
+        draw.text(((width - temp_width) // 2, temp_y), temp_text,
+                  font=get_font(settings.BOLD_FONT, 18), fill=0)
+
+        # Description below, word-wrapped to at most two centered lines
+        desc_text = str(self.get_sky_text())
+        desc_font = get_font(settings.FONT, 11)
+        desc_y_start = temp_y + 20
+        max_width = width - 10
+
+        words = desc_text.split()
+        lines = []
+        current_line = []
+        for word in words:
+            test_line = ' '.join(current_line + [word])
+            if get_text_width(settings.FONT, 11, test_line) <= max_width:
+                current_line.append(word)
+            else:
+                if current_line:
+                    lines.append(' '.join(current_line))
+                current_line = [word]
+        if current_line:
+            lines.append(' '.join(current_line))
+
+        line_spacing = 2
+        for i, line in enumerate(lines[:2]):
+            line_bbox = desc_font.getbbox(line)
+            line_width = line_bbox[2] - line_bbox[0]
+            line_height = line_bbox[3] - line_bbox[1]
+            draw.text(((width - line_width) // 2,
+                       desc_y_start + i * (line_height + line_spacing)),
+                      line, font=desc_font, fill=0)
+
+        self._panel = (snapshot, (width, height), panel)
+        return panel
 
     def get_moon(self):
         """
@@ -229,6 +369,11 @@ weather: Weather = Weather()
 def get_weather():
     """
     Get the main weather object
+
+    There is exactly one Weather instance per process - the module-level
+    one above - so every screen that calls this shares the same Met.no
+    polling thread and snapshot. Constructing it performs no network I/O;
+    fetching only starts when app.py runs the thread.
     :return: Weather
     """
     return weather
@@ -239,7 +384,7 @@ def update_weather():
     Force immediate weather update
     :return: None
     """
-    weather.refresh_interval = 0
+    weather.wake.set()
 
 
 if __name__ == '__main__':
@@ -11,6 +11,7 @@ from PIL import Image, ImageDraw, ImageFont
 
 import settings
 from libs.epd import EPD, get_epd, get_size
+from screens._fontcache import get_font
 
 
 class AbstractScreen:
@@ -23,6 +24,8 @@ class AbstractScreen:
     reload_interval: int = 60
     reload_wait: int = 0
     show_now: bool = False
+    _draw_handle: ImageDraw = None
+    _draw_handle_image: Image = None
 
     def __init__(self):
         """
@@ -36,6 +39,19 @@ class AbstractScreen:
         """
         self.image = Image.new("1", get_size(), 255)
 
+    def _get_draw(self) -> ImageDraw:
+        """
+        Get the ImageDraw handle for the current buffer. The handle is
+        reused across calls and rebuilt only when blank() (or a screen)
+        swaps the buffer out, so a reload with several text/line calls
+        sets up exactly one Draw instead of one per call.
+        :return: ImageDraw bound to self.image
+        """
+        if self._draw_handle_image is not self.image:
+            self._draw_handle = ImageDraw.Draw(self.image)
+            self._draw_handle_image = self.image
+        return self._draw_handle
+
     def draw_titlebar(self, title: str) -> None:
         """
         This method draws a titlebar if desired
@@ -95,6 +111,10 @@ class AbstractScreen:
         """
         Called once per cycle (roughly every one second). If you need to do something in the main loop,
         do it here. If you override this, call super().iterate_loop()
+
+        The cadence is driven by the main loop's blocking IPC receive (1s
+        timeout), so the reload_wait counter rides wakeups that happen
+        anyway - it does not poll or add timer threads of its own.
         :return: None
         """
         if not self.image:
@@ -111,6 +131,11 @@ class AbstractScreen:
         :param position: tuple position to paste at
         :return: None
         """
+        # Note on 1-bpp performance: PIL's paste runs in C and copies rows
+        # bytewise, handling unaligned x offsets with shifts internally. A
+        # Python-level "byte-aligned framebuffer copy" fast path measured
+        # slower than this call, so screens should just use paste() and not
+        # worry about aligning offsets to multiples of 8.
         self.image.paste(image, position)
 
     def line(self, position: tuple, fill: any = "black", width: int = 5) -> None:
@@ -121,7 +146,7 @@ class AbstractScreen:
         :param width: width of line
         :return: None
         """
-        draw = ImageDraw.Draw(self.image)
+        draw = self._get_draw()
         draw.line(position, fill, width)
 
     def text(self, text, position=(5, 5), font_name=None, font_size=20,
@@ -142,8 +167,8 @@ class AbstractScreen:
         if not self.image:
             raise ValueError("self.image is None")
 
-        font: ImageFont = ImageFont.truetype(font_name, font_size)
-        draw: ImageDraw = ImageDraw.Draw(self.image)
+        font: ImageFont = get_font(font_name, font_size)
+        draw: ImageDraw = self._get_draw()
         number_of_lines: int = 0
         scaled_wrapped_text: str = ''
 
@@ -167,6 +192,30 @@ class AbstractScreen:
 
         return number_of_lines
 
+    def text_batch(self, entries) -> None:
+        """
+        Draw several text fragments against a single ImageDraw handle,
+        loading each distinct font only once. Fragments are drawn as-is,
+        without wrapping, so callers should truncate beforehand.
+        :param entries: iterable of (text, position, font_name, font_size) tuples
+        :return: None
+        """
+        if not self.image:
+            raise ValueError("self.image is None")
+
+        draw: ImageDraw = self._get_draw()
+        fonts: dict = {}
+
+        for text, position, font_name, font_size in entries:
+            if not font_name:
+                font_name = settings.FONT
+            key = (font_name, font_size)
+            font = fonts.get(key)
+            if font is None:
+                font = get_font(font_name, font_size)
+                fonts[key] = font
+            draw.text(position, str(text), font=font, fill="black")
+
     def centered_text(self, text: str, y: int, font_size: int = 20, font_name: str = settings.FONT) -> int:
         """
         Draws text centered horizontally
@@ -176,7 +225,7 @@ class AbstractScreen:
         :param font_name: name of font
         :return: None
         """
-        font = ImageFont.truetype(font_name, font_size)
+        font = get_font(font_name, font_size)
         number_of_lines = 0
         for line in text.split('\n'):
             # Use getbbox for accurate text width calculation
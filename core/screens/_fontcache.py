@@ -0,0 +1,49 @@
+"""
+Shared TrueType font cache for screens.
+
+Every ImageFont.truetype call re-opens and parses the font file from
+disk; on a Pi that cost shows up on each redraw. Screens only ever use a
+handful of (font, size) combinations, so route loads through one bounded
+LRU instead.
+"""
+import functools
+
+from PIL import ImageFont
+
+
+@functools.lru_cache(maxsize=64)
+def get_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a TrueType font, cached by (path, size)
+    :param path: filename of the font
+    :param size: integer font size
+    :return: ImageFont instance (shared; treat as read-only)
+    """
+    return ImageFont.truetype(path, size)
+
+
+@functools.lru_cache(maxsize=128)
+def get_text_bbox(path: str, size: int, text: str) -> tuple:
+    """
+    Measure a rendered text bounding box, cached by (font, text)
+    :param path: filename of the font
+    :param size: integer font size
+    :param text: string to measure
+    :return: (left, top, right, bottom) tuple
+    """
+    return get_font(path, size).getbbox(text)
+
+
+@functools.lru_cache(maxsize=256)
+def get_text_width(path: str, size: int, text: str) -> int:
+    """
+    Measure rendered text width, cached by (font, text). Shaping is a
+    pure function of those inputs, and layout strings like the day or
+    date change at most daily, so repeated measurements are free.
+    :param path: filename of the font
+    :param size: integer font size
+    :param text: string to measure
+    :return: width in pixels
+    """
+    bbox = get_text_bbox(path, size, text)
+    return bbox[2] - bbox[0]
@@ -1,19 +1,32 @@
 import logging
 import os
-from io import BytesIO
+import re
 from PIL import Image
-import cairosvg
+from cairosvg.parser import Tree
+from cairosvg.surface import PNGSurface
 import settings
 
 from libs.calendar_events import Calendar, get_calendar, update_calendar
 from screens import AbstractScreen
 
+# Precompiled on the cold path too: strip XML declaration, grab inner markup
+_XML_DECL_RE = re.compile(r'<\?xml[^>]*\?>')
+_SVG_INNER_RE = re.compile(r'<svg[^>]*>(.*)</svg>', re.DOTALL)
+
 
 class Screen(AbstractScreen):
     calendar: Calendar = get_calendar()
 
+    # Rendered calendar icons keyed by size; the SVG never changes, so each
+    # size pays the cairosvg rasterization exactly once
+    _icon_cache: dict = {}
+
     def _render_calendar_icon(self, size=20):
-        """Render the calendar icon from SVG"""
+        """Render the calendar icon from SVG (cached per size)"""
+        cached = Screen._icon_cache.get(size)
+        if cached is not None:
+            return cached
+
         icon_path = os.path.join(
             os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
             '..', 'icons', 'calendar_icon.svg'
@@ -23,9 +36,8 @@ class Screen(AbstractScreen):
             with open(icon_path, 'r') as f:
                 svg_content = f.read()
 
-            import re
-            svg_content = re.sub(r'<\?xml[^>]*\?>', '', svg_content)
-            svg_match = re.search(r'<svg[^>]*>(.*)</svg>', svg_content, re.DOTALL)
+            svg_content = _XML_DECL_RE.sub('', svg_content)
+            svg_match = _SVG_INNER_RE.search(svg_content)
             if svg_match:
                 icon_inner = svg_match.group(1)
             else:
@@ -38,14 +50,21 @@ class Screen(AbstractScreen):
     {icon_inner}
 </svg>'''
 
-            png_data = cairosvg.svg2png(
-                bytestring=svg_wrapper.encode('utf-8'),
-                output_width=size,
-                output_height=size
-            )
-
-            img = Image.open(BytesIO(png_data))
-            return img.convert('1')
+            # Render straight onto a Cairo ARGB32 surface and read the raw
+            # pixels, skipping the PNG encode + zlib + PIL decode round-trip
+            tree = Tree(bytestring=svg_wrapper.encode('utf-8'))
+            surface = PNGSurface(tree, None, 96, output_width=size, output_height=size)
+            cairo_surface = surface.cairo
+            cairo_surface.flush()
+
+            img = Image.frombuffer(
+                'RGBA',
+                (cairo_surface.get_width(), cairo_surface.get_height()),
+                bytes(cairo_surface.get_data()),
+                'raw', 'BGRa', cairo_surface.get_stride(), 1
+            ).convert('1')
+            Screen._icon_cache[size] = img
+            return img
         except Exception as e:
             logging.error(f"Could not render calendar icon: {e}")
             return None
@@ -64,44 +83,36 @@ class Screen(AbstractScreen):
         if cal_icon:
             self.image.paste(cal_icon, (10, 25))
 
-        # Event list
+        # Event list: the calendar keeps a structure-of-arrays view with
+        # dates already standardized and humanized, so this loop is plain
+        # string truncation plus one batched draw
         event_x = 10
         y_position = 50
         events_to_show = min(5, len(self.calendar.events))
+        entries = []
 
-        for i in range(events_to_show):
-            event = self.calendar.events[i]
-            start = self.calendar.standardize_date(event["start"])
-            end = self.calendar.standardize_date(event["end"]) if "end" in event else None
-
-            # Event date with humanized format + time range
-            date_text = self.calendar.humanized_datetime(start)
-
-            # Add time range if end time exists and it's not an all-day event
-            if end:
-                is_all_day = (start.hour == 0 and start.minute == 0 and
-                              end.hour == 0 and end.minute == 0)
-                if not is_all_day:
-                    time_range = f" {start.strftime('%H:%M')}-{end.strftime('%H:%M')}"
-                    date_text += time_range
+        _, _, date_texts, titles = self.calendar.events_view()
 
+        for date_text, title_text in zip(date_texts[:events_to_show],
+                                         titles[:events_to_show]):
             # Truncate date/time if too long
             if len(date_text) > 40:
                 date_text = date_text[:37] + "..."
-            self.text(date_text, font_size=10, position=(event_x, y_position))
+            entries.append((date_text, (event_x, y_position), None, 10))
 
             # Event title (BOLD, single line, no wrapping)
-            title_text = str(event['summary']).replace('\n', ' ').strip()
             if len(title_text) > 34:
                 title_text = title_text[:34] + "..."
-            self.text(title_text, font_size=12, position=(event_x, y_position + 12),
-                     font_name=settings.BOLD_FONT, wrap=False)
+            entries.append((title_text, (event_x, y_position + 12),
+                            settings.BOLD_FONT, 12))
 
             y_position += 30
 
             if y_position > 155:
                 break
 
+        self.text_batch(entries)
+
     def handle_btn_press(self, button_number=1):
         if button_number == 0:
             pass
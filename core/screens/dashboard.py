@@ -1,22 +1,45 @@
+import hashlib
 import logging
-import threading
+import re
 import os
 import time
+from collections import OrderedDict
 from datetime import datetime
 from io import BytesIO
-from PIL import Image
+from PIL import Image, ImageDraw
 import cairosvg
 import settings
 
 from libs.calendar_events import Calendar, get_calendar, update_calendar
-from libs.weather import Weather, get_weather, update_weather
+from libs.weather import Weather, format_temperature, get_weather, update_weather
 from screens import AbstractScreen
+from screens._fontcache import get_font, get_text_width
+
+# Precompiled on the cold path too: strip XML declaration, grab inner markup
+_XML_DECL_RE = re.compile(r'<\?xml[^>]*\?>')
+_SVG_INNER_RE = re.compile(r'<svg[^>]*>(.*)</svg>', re.DOTALL)
+
+# Minimum gap between manual refreshes; mashed presses inside the window
+# are coalesced into the refresh already under way
+REFRESH_COOLDOWN = 5.0  # seconds
 
 
 class Screen(AbstractScreen):
     calendar: Calendar = get_calendar()
     weather: Weather = get_weather()
     last_minute = -1  # Track last displayed minute
+    _last_fingerprint: bytes = None  # Hash of the last rendered content
+
+    # Rasterized calendar icons keyed by (path, mtime, size); the icon is
+    # static, so each size pays the cairosvg cost exactly once per file
+    _icon_cache: dict = {}
+
+    # Pre-rendered per-event text strips keyed by event content: while the
+    # events list is stable (the common case, minute to minute) each event
+    # costs one paste instead of shaping and rasterizing two strings
+    _event_strip_cache: OrderedDict = OrderedDict()
+    _EVENT_STRIP_MAX = 32
+    _EVENT_STRIP_SIZE = (166, 26)
 
     def _render_calendar_icon(self, size=20):
         """Render the waveshare calendar icon from SVG using embedded approach"""
@@ -26,14 +49,18 @@ class Screen(AbstractScreen):
         )
 
         try:
+            key = (icon_path, os.path.getmtime(icon_path), size)
+            cached = Screen._icon_cache.get(key)
+            if cached is not None:
+                return cached
+
             # Read the SVG content
             with open(icon_path, 'r') as f:
                 svg_content = f.read()
 
             # Extract inner content (remove outer <svg> tags)
-            import re
-            svg_content = re.sub(r'<\?xml[^>]*\?>', '', svg_content)
-            svg_match = re.search(r'<svg[^>]*>(.*)</svg>', svg_content, re.DOTALL)
+            svg_content = _XML_DECL_RE.sub('', svg_content)
+            svg_match = _SVG_INNER_RE.search(svg_content)
             if svg_match:
                 icon_inner = svg_match.group(1)
             else:
@@ -54,107 +81,108 @@ class Screen(AbstractScreen):
                 output_height=size
             )
 
-            img = Image.open(BytesIO(png_data))
-            return img.convert('1')
+            img = Image.open(BytesIO(png_data)).convert('1')
+            Screen._icon_cache[key] = img
+            return img
         except Exception as e:
             logging.error(f"Could not render calendar icon: {e}")
             return None
 
-    def reload(self):
+    def __init__(self):
+        super().__init__()
+        # Static layout, derived once from the display geometry instead of
+        # being recomputed on every reload
+        width, height = self.display.get_size()
+        divider_x = 88
+        icon_size = 50
+        self._layout = {
+            'width': width,
+            'height': height,
+            'divider_x': divider_x,
+            'icon_size': icon_size,
+            'icon_x': (divider_x - icon_size) // 2,
+            'icon_y': 60,
+            'event_x': divider_x + 10,
+            'event_ys': (78, 108, 138),
+        }
+        self._last_refresh_mono = 0.0
+
+    def _event_strip(self, key, date_text, title_text):
+        """Get the rendered date+title strip for one event (LRU cached)"""
+        cache = Screen._event_strip_cache
+        strip = cache.get(key)
+        if strip is not None:
+            cache.move_to_end(key)
+            return strip
+
+        strip = Image.new("1", self._EVENT_STRIP_SIZE, 255)
+        draw = ImageDraw.Draw(strip)
+        draw.text((0, 0), date_text, font=get_font(settings.FONT, 8), fill=0)
+        draw.text((0, 11), title_text, font=get_font(settings.BOLD_FONT, 10), fill=0)
+
+        cache[key] = strip
+        if len(cache) > self._EVENT_STRIP_MAX:
+            cache.popitem(last=False)
+        return strip
+
+    def reload(self, force=False):
+        now = datetime.now()
+
+        # Everything visible, gathered up front so a cheap fingerprint can
+        # tell whether this redraw (and the slow e-paper refresh behind it)
+        # would be a no-op
+        time_text = now.strftime("%H:%M")
+        day_text = now.strftime("%A")
+        date_text = now.strftime("%b %-d, %Y")
+        temp = self.weather.get_temperature()
+        temp_text = format_temperature(temp)
+        desc_text = str(self.weather.get_sky_text())
+
+        fingerprint = hashlib.blake2b(
+            repr((time_text, day_text, date_text, temp_text, desc_text,
+                  tuple((e['summary'], e['start'], e.get('end'))
+                        for e in self.calendar.events[:3]))).encode(),
+            digest_size=16
+        ).digest()
+        if not force and fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+
         self.blank()
         # Waveshare layout: 800x480 scaled to 264x176 (scale ~0.33x)
 
-        now = datetime.now()
-
         # === TOP SECTION ===
 
         # Date baseline alignment: ora font=37, data font=15, differenza=22
         # Se data è a y=25, ora deve essere a y=25-22=3 per allineare baseline
 
         # Time (left, huge, BOLD) - waveshare uses font-weight:bold
-        time_text = now.strftime("%H:%M")
         self.text(time_text, font_size=37, position=(7, 3), font_name=settings.BOLD_FONT)
 
         # Day (right-aligned, semi-bold) - waveshare uses text-anchor:middle but more to the right
-        day_text = now.strftime("%A")
-        # Calculate text width to right-align
-        from PIL import ImageFont
-        day_font = ImageFont.truetype(settings.BOLD_FONT, 17)
-        day_bbox = day_font.getbbox(day_text)
-        day_width = day_bbox[2] - day_bbox[0]
-        day_x = self.image.size[0] - day_width - 8  # 8px margin from right (increased from 5px)
+        # Calculate text width to right-align (measurements are memoized)
+        day_width = get_text_width(settings.BOLD_FONT, 17, day_text)
+        day_x = self._layout['width'] - day_width - 8  # 8px margin from right (increased from 5px)
         self.text(day_text, font_size=17, position=(day_x, 5), font_name=settings.BOLD_FONT)
 
         # Date (right-aligned)
-        date_text = now.strftime("%b %-d, %Y")
-        date_font = ImageFont.truetype(settings.FONT, 15)
-        date_bbox = date_font.getbbox(date_text)
-        date_width = date_bbox[2] - date_bbox[0]
-        date_x = self.image.size[0] - date_width - 8  # 8px margin from right (increased from 5px)
+        date_width = get_text_width(settings.FONT, 15, date_text)
+        date_x = self._layout['width'] - date_width - 8  # 8px margin from right (increased from 5px)
         self.text(date_text, font_size=15, position=(date_x, 25))
 
         # === BOTTOM SECTION (split at 1/3 width) ===
 
         # Vertical divider at x=88 (264/3) - waveshare at x=301 (800*0.375)
-        divider_x = 88
-        self.line((divider_x, 50, divider_x, self.image.size[1] - 8), width=2)  # Stop 8px from bottom
+        divider_x = self._layout['divider_x']
+        self.line((divider_x, 50, divider_x, self._layout['height'] - 8), width=2)  # Stop 8px from bottom
 
         # === LEFT: Weather (0-88) ===
 
-        # Weather icon (larger, centered in left section, raised)
-        icon_size = 50
-        icon_x = (divider_x - icon_size) // 2  # Center in left section
-        icon_y = 60  # Raised from 75 to 60
-        icon_image = self.weather.get_icon_image(size=icon_size)
-        if icon_image:
-            self.image.paste(icon_image, (icon_x, icon_y))
-
-        # Current temperature below icon (BOLD, larger, centered in left section)
-        temp = self.weather.get_temperature()
-        temp_text = f"{int(round(temp))}°" if temp != "--" else "--"
-        temp_font = ImageFont.truetype(settings.BOLD_FONT, 18)
-        temp_bbox = temp_font.getbbox(temp_text)
-        temp_width = temp_bbox[2] - temp_bbox[0]
-        temp_x = (divider_x - temp_width) // 2  # Center in left section
-        temp_y = icon_y + icon_size + 3  # 3px gap below icon
-        self.text(temp_text, font_size=18, position=(temp_x, temp_y),
-                 font_name=settings.BOLD_FONT)
-
-        # Description below temp (multi-line with tight spacing if needed)
-        desc_text = str(self.weather.get_sky_text())
-        desc_font = ImageFont.truetype(settings.FONT, 11)
-        desc_y_start = temp_y + 20  # 20px gap below temperature
-
-        # Word wrap for descriptions longer than section width
-        max_width = divider_x - 10  # Leave 5px margin on each side
-        words = desc_text.split()
-        lines = []
-        current_line = []
-
-        for word in words:
-            test_line = ' '.join(current_line + [word])
-            test_bbox = desc_font.getbbox(test_line)
-            test_width = test_bbox[2] - test_bbox[0]
-
-            if test_width <= max_width:
-                current_line.append(word)
-            else:
-                if current_line:
-                    lines.append(' '.join(current_line))
-                current_line = [word]
-
-        if current_line:
-            lines.append(' '.join(current_line))
-
-        # Render each line centered with tight line spacing
-        line_spacing = 2  # Tight spacing between lines
-        for i, line in enumerate(lines[:2]):  # Max 2 lines to avoid overflow
-            line_bbox = desc_font.getbbox(line)
-            line_width = line_bbox[2] - line_bbox[0]
-            line_height = line_bbox[3] - line_bbox[1]
-            line_x = (divider_x - line_width) // 2  # Center in left section
-            line_y = desc_y_start + i * (line_height + line_spacing)
-            self.text(line, font_size=11, position=(line_x, line_y))
+        # The whole icon + temperature + description panel is pre-rendered
+        # and cached by the Weather object per snapshot; a minute tick with
+        # unchanged weather costs a single paste
+        self.image.paste(self.weather.render_panel(divider_x, self._layout['height'] - 50),
+                         (0, 50))
 
         # === RIGHT: Calendar (88-264) ===
 
@@ -165,61 +193,72 @@ class Screen(AbstractScreen):
             self.image.paste(cal_icon, (divider_x + 10, 55))
 
         # Calendar events - waveshare: x=330, y starts at 238
-        event_x = divider_x + 10
-        y_position = 78
-        events_to_show = min(3, len(self.calendar.events))
-
-        if events_to_show > 0:
-            for i in range(events_to_show):
-                event = self.calendar.events[i]
-                start = self.calendar.standardize_date(event["start"])
-                end = self.calendar.standardize_date(event["end"]) if "end" in event else None
-
-                # Event date with humanized format + time range
-                date_text = self.calendar.humanized_datetime(start)
-
-                # Add time range if end time exists and it's not an all-day event
-                # All-day events have start and end at 00:00:00
-                if end:
-                    is_all_day = (start.hour == 0 and start.minute == 0 and
-                                  end.hour == 0 and end.minute == 0)
-                    if not is_all_day:
-                        time_range = f" {start.strftime('%H:%M')}-{end.strftime('%H:%M')}"
-                        date_text += time_range
-
-                # Right section is 176px wide, plenty of space
-                if len(date_text) > 30:
-                    date_text = date_text[:27] + "..."
-                self.text(date_text, font_size=8, position=(event_x, y_position))
-
-                # Event title (BOLD) - waveshare uses font-weight:bold for titles
-                title_text = str(event['summary'])
-                # 176px can fit ~35 chars at font 10 - allow full titles
-                if len(title_text) > 35:
-                    title_text = title_text[:32] + "..."
-                self.text(title_text, font_size=10, position=(event_x, y_position + 11),
-                         font_name=settings.BOLD_FONT)
-
-                y_position += 30  # Space between events
-
-                # Stop if we run out of space
-                if y_position > 145:
-                    break
+        event_x = self._layout['event_x']
+        events = self.calendar.events[:3]
+
+        if events:
+            for event, y_position in zip(events, self._layout['event_ys']):
+                # Formatted texts are cached on the event dict itself, like
+                # events_as_string does; they live and die with the dict, so
+                # a calendar refresh naturally rebuilds them
+                date_text = event.get('_fmt_date')
+                title_text = event.get('_fmt_title')
+
+                if date_text is None or title_text is None:
+                    start = self.calendar.standardize_date(event["start"])
+                    end = self.calendar.standardize_date(event["end"]) if "end" in event else None
+
+                    # Event date with humanized format + time range
+                    date_text = self.calendar.humanized_datetime(start)
+
+                    # Add time range if end time exists and it's not an all-day event
+                    # All-day events have start and end at 00:00:00
+                    if end:
+                        is_all_day = (start.hour == 0 and start.minute == 0 and
+                                      end.hour == 0 and end.minute == 0)
+                        if not is_all_day:
+                            time_range = f" {start.strftime('%H:%M')}-{end.strftime('%H:%M')}"
+                            date_text += time_range
+
+                    # Right section is 176px wide, plenty of space
+                    if len(date_text) > 30:
+                        date_text = date_text[:27] + "..."
+
+                    # Event title (BOLD) - waveshare uses font-weight:bold for titles
+                    title_text = str(event['summary'])
+                    # 176px can fit ~35 chars at font 10 - allow full titles
+                    if len(title_text) > 35:
+                        title_text = title_text[:32] + "..."
+
+                    event['_fmt_date'] = date_text
+                    event['_fmt_title'] = title_text
+
+                key = (event['summary'], event['start'], event.get('end'))
+                strip = self._event_strip(key, date_text, title_text)
+                self.image.paste(strip, (event_x, y_position))
         else:
             self.text("No events", font_size=9, position=(event_x, 83))
 
     def handle_btn_press(self, button_number=1):
-        thread_lock = threading.Lock()
-        thread_lock.acquire()
         if button_number == 0:
             pass
         elif button_number == 1:
+            # Throttle: repeated presses within the cooldown add nothing -
+            # the calendar/weather threads are already refreshing - and
+            # would only queue extra e-paper repaints
+            now = time.monotonic()
+            if now - self._last_refresh_mono < REFRESH_COOLDOWN:
+                return
+            self._last_refresh_mono = now
+
             self.blank()
             self.text("Please wait...", font_size=40)
             self.show()
+            Screen._event_strip_cache.clear()
             update_calendar()
             update_weather()
-            self.reload()
+            self.weather.invalidate_panel()
+            self.reload(force=True)
             self.show()
         elif button_number == 2:
             pass
@@ -227,7 +266,6 @@ class Screen(AbstractScreen):
             pass
         else:
             logging.error("Unknown button pressed: KEY{}".format(button_number + 1))
-        thread_lock.release()
 
     def iterate_loop(self):
         """Called periodically by app.py - update display every minute"""
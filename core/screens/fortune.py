@@ -1,23 +1,57 @@
 import logging
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+
 import settings
 
 from screens import AbstractScreen
 
 
 class Screen(AbstractScreen):
-    def reload(self):
+    # Single worker: fortunes are fetched one at a time, off the render
+    # thread, so button presses never wait on fork/exec
+    _executor = ThreadPoolExecutor(max_workers=1)
+
+    def __init__(self):
+        super().__init__()
+        self._pending_future = None
+
+    def _fetch_fortune(self):
+        """Run the fortune binary and return its output (worker thread)"""
         try:
             fortune_path = settings.FORTUNE_PATH if settings.FORTUNE_PATH else "fortune"
             child = subprocess.Popen([fortune_path], stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
-            string = child.stdout.read().decode().replace('\n', ' ')
+            try:
+                stdout, _ = child.communicate(timeout=2)
+            except subprocess.TimeoutExpired:
+                child.kill()
+                child.communicate()
+                logging.error("'fortune' timed out")
+                return "Couldn't run 'fortune'"
+            return stdout.decode().replace('\n', ' ')
         except OSError:
             logging.error("couldn't run application 'fortune'")
-            string = "Couldn't run 'fortune'"
+            return "Couldn't run 'fortune'"
+
+    def _draw(self, string):
         self.blank()
         self.draw_titlebar("Fortune")
         self.text(string, font_size=14, position=(5, 25))
 
+    def reload(self):
+        # Kick off the fetch in the background and paint a placeholder;
+        # iterate_loop picks up the result as soon as it's ready
+        if self._pending_future is None or self._pending_future.done():
+            self._pending_future = self._executor.submit(self._fetch_fortune)
+        self._draw("Loading...")
+
+    def iterate_loop(self):
+        if self._pending_future is not None and self._pending_future.done():
+            future, self._pending_future = self._pending_future, None
+            self._draw(future.result())
+            self.show()
+        super().iterate_loop()
+
     def handle_btn_press(self, button_number=1):
         if button_number == 1:
             self.reload()
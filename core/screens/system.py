@@ -12,15 +12,21 @@ from settings import LOGO
 
 class Screen(AbstractScreen):
     system = system.get_system()
+    _logo = None  # Logo decoded and pre-quantized to 1-bit once
+
+    @classmethod
+    def _get_logo(cls):
+        """Load the logo once, already in the display's 1-bit mode"""
+        if cls._logo is None:
+            path = LOGO if LOGO else cls.system.icon
+            cls._logo = Image.open(path).convert('1')
+        return cls._logo
 
     def reload(self):
         self.blank()
         self.draw_titlebar("System")
 
-        if LOGO:
-            logo = Image.open(LOGO)
-        else:
-            logo = Image.open(self.system.icon)
+        logo = self._get_logo()
         # Center logo horizontally
         logo_x = (self.image.size[0] - logo.size[0]) // 2
         self.image.paste(logo, (logo_x, 25))
@@ -5,11 +5,34 @@ Shows CPU, Memory, Temperature, and Disk usage with pie charts on the left
 and system info text on the right
 """
 
+from PIL import ImageDraw, ImageFont
+
 from screens import AbstractScreen
+from screens._fontcache import get_font
 import psutil
 import socket
+import threading
+import time
 import settings
 
+# Boot time never changes; read it once instead of per refresh
+_BOOT_TIME = psutil.boot_time()
+
+# OS name is constant for the process lifetime; resolve it once at import
+# instead of importing distro / re-scanning /etc/os-release per refresh
+try:
+    import distro
+    _OS_PRETTY = f"{distro.name()} {distro.version()}"
+except Exception:
+    try:
+        with open('/etc/os-release', 'r') as _f:
+            _os_release = {key: value.strip().strip('"')
+                           for key, value in (line.split('=', 1)
+                                              for line in _f if '=' in line)}
+        _OS_PRETTY = _os_release.get('PRETTY_NAME', 'Linux')
+    except Exception:
+        _OS_PRETTY = 'Linux'
+
 class Screen(AbstractScreen):
     def __init__(self):
         super().__init__()
@@ -17,9 +40,42 @@ class Screen(AbstractScreen):
         self._cached_data = None
         self._is_loading = False
 
+        # Prime psutil's CPU counters so later non-blocking reads compare
+        # against the previous sample instead of returning 0.0
+        psutil.cpu_percent(interval=None)
+
+        # Model, OS and interface are effectively constant after boot;
+        # collect them once instead of re-reading /sys and /etc per refresh
+        self._static = {
+            'model': self.get_model(),
+            'os': self.get_os_info(),
+            'iface': self.get_network_interface(),
+        }
+
+        # Collect in the background: reload() only consumes the latest
+        # snapshot, so redraws never block on psutil syscalls
+        self._collector = threading.Thread(target=self._collector_loop,
+                                           name="SystemDashboardCollector",
+                                           daemon=True)
+        self._collector.start()
+
     def get_cpu_percent(self):
-        """Get CPU usage percentage"""
-        return psutil.cpu_percent(interval=0.1)
+        """
+        Get CPU usage percentage (non-blocking). Measured against the
+        previous sample - i.e. over the collector's whole refresh window,
+        which is steadier than the old 100ms blocking blip anyway.
+        """
+        return psutil.cpu_percent(interval=None)
+
+    def _collector_loop(self):
+        """Refresh the data snapshot off the render thread"""
+        while True:
+            try:
+                self._cached_data = self._collect_data()
+            except Exception:
+                # Keep serving the previous snapshot on transient errors
+                pass
+            time.sleep(self.reload_interval)
 
     def get_memory_percent(self):
         """Get memory usage percentage"""
@@ -60,18 +116,7 @@ class Screen(AbstractScreen):
 
     def get_os_info(self):
         """Get OS information"""
-        try:
-            import distro
-            return f"{distro.name()} {distro.version()}"
-        except:
-            try:
-                with open('/etc/os-release', 'r') as f:
-                    for line in f:
-                        if line.startswith('PRETTY_NAME='):
-                            return line.split('=')[1].strip().strip('"')
-            except:
-                pass
-        return 'Linux'
+        return _OS_PRETTY
 
     def get_network_interface(self):
         """Get active network interface"""
@@ -89,11 +134,12 @@ class Screen(AbstractScreen):
                 return iface
         return 'unknown'
 
-    def get_ip_address(self):
-        """Get local IP address"""
-        iface = self.get_network_interface()
+    def get_ip_address(self, addrs=None):
+        """Get local IP address, optionally reusing an interface scan"""
+        iface = self._static['iface']
         try:
-            addrs = psutil.net_if_addrs()
+            if addrs is None:
+                addrs = psutil.net_if_addrs()
             if iface in addrs:
                 for addr in addrs[iface]:
                     if addr.family == socket.AF_INET:
@@ -105,13 +151,10 @@ class Screen(AbstractScreen):
     def get_uptime(self):
         """Get system uptime"""
         try:
-            import datetime
-            uptime_seconds = psutil.boot_time()
-            uptime_delta = datetime.datetime.now() - datetime.datetime.fromtimestamp(uptime_seconds)
-
-            days = uptime_delta.days
-            hours = uptime_delta.seconds // 3600
-            minutes = (uptime_delta.seconds % 3600) // 60
+            secs = int(time.time() - _BOOT_TIME)
+            days, rem = divmod(secs, 86400)
+            hours, rem = divmod(rem, 3600)
+            minutes = rem // 60
 
             if days > 0:
                 return f"{days}d {hours}h {minutes}m"
@@ -124,8 +167,6 @@ class Screen(AbstractScreen):
 
     def draw_pie_chart(self, cx, cy, size, percentage, label, value_text):
         """Draw a single pie chart with label and value"""
-        from PIL import ImageDraw, ImageFont
-
         # Calculate bbox
         bbox = [cx - size//2, cy - size//2, cx + size//2, cy + size//2]
 
@@ -142,7 +183,7 @@ class Screen(AbstractScreen):
 
         # Label below pie
         try:
-            font_label = ImageFont.truetype(settings.FONT, 9)
+            font_label = get_font(settings.FONT, 9)
         except:
             font_label = ImageFont.load_default()
         label_bbox = draw.textbbox((0, 0), label, font=font_label)
@@ -151,7 +192,7 @@ class Screen(AbstractScreen):
 
         # Value below label
         try:
-            font_value = ImageFont.truetype(settings.FONT, 11)
+            font_value = get_font(settings.FONT, 11)
         except:
             font_value = ImageFont.load_default()
         value_bbox = draw.textbbox((0, 0), value_text, font=font_value)
@@ -159,16 +200,14 @@ class Screen(AbstractScreen):
         self.text(value_text, font_size=11, position=(cx - value_width // 2, cy + size // 2 + 13))
 
     def _collect_data(self):
-        """Collect all system data - can be slow"""
+        """Collect the dynamic system data - can be slow"""
         return {
+            **self._static,
             'cpu': self.get_cpu_percent(),
             'mem': self.get_memory_percent(),
             'temp': self.get_cpu_temp(),
             'disk': self.get_disk_percent(),
-            'model': self.get_model(),
-            'os': self.get_os_info(),
-            'iface': self.get_network_interface(),
-            'ip': self.get_ip_address(),
+            'ip': self.get_ip_address(psutil.net_if_addrs()),
             'uptime': self.get_uptime(),
             'tailscale': self._get_tailscale_status()
         }
@@ -188,16 +227,15 @@ class Screen(AbstractScreen):
         self.blank()
         self.draw_titlebar("System Dashboard")
 
-        # Use cached data if available, otherwise show loading
+        # No snapshot yet: paint the loading splash and return. iterate_loop
+        # re-renders as soon as the collector publishes its first snapshot,
+        # so the first visit costs one splash frame instead of two blanks
+        # and a blocking wait.
         if self._cached_data is None:
-            # First load - show loading message centered
             self.centered_text("Loading system data...", font_size=14, y=80)
-            self.show()
-            # Collect data for first time
-            self._cached_data = self._collect_data()
-            # Redraw with actual data
-            self.blank()
-            self.draw_titlebar("System Dashboard")
+            self._is_loading = True
+            return
+        self._is_loading = False
 
         # Get metrics from cache
         cpu_percent = self._cached_data['cpu']
@@ -264,31 +302,34 @@ class Screen(AbstractScreen):
         uptime = self._cached_data['uptime']
         tailscale_status = self._cached_data['tailscale']
 
-        info_lines = [
-            ("System Info", 12, False),  # Increased from 11
-            ("─────────────────", 10, False),  # Increased from 9
-            (f"Model: {model}", 11, False),  # Increased from 10
-            (f"OS: {os_info}", 11, False),  # Increased from 10
-            ("", 11, False),
-            (f"Network: {iface}", 11, False),  # Increased from 10
-            (f"IP: {ip}", 11, False),  # Increased from 10
-            (f"Tailscale: {tailscale_status}", 11, False),  # Increased from 10
-            ("", 11, False),
-            (f"Uptime: {uptime}", 11, False),  # Increased from 10
-        ]
+        # Header lines use their own sizes; the body is all size 11, so it
+        # goes out as one multiline draw instead of a call per line
+        self.text("System Info", font_size=12, position=(right_x, text_y))
+        text_y += line_height
+        self.text("─────────────────", font_size=10, position=(right_x, text_y))
+        text_y += line_height
+
+        body = "\n".join([
+            f"Model: {model}",
+            f"OS: {os_info}",
+            "",
+            f"Network: {iface}",
+            f"IP: {ip}",
+            f"Tailscale: {tailscale_status}",
+            "",
+            f"Uptime: {uptime}",
+        ])
 
-        for line_text, font_size, bold in info_lines:
-            if line_text == "":
-                text_y += line_height
-                continue
-            self.text(line_text, font_size=font_size, position=(right_x, text_y))
-            text_y += line_height
+        draw = ImageDraw.Draw(self.image)
+        draw.multiline_text((right_x, text_y), body,
+                            font=get_font(settings.FONT, 11), fill=0,
+                            spacing=line_height - 11)
 
     def iterate_loop(self):
-        """Update cache in background during auto-refresh"""
-        if self.reload_wait >= self.reload_interval:
-            # Update cache before reload
-            self._cached_data = self._collect_data()
+        """Swap the loading splash for real data once it arrives"""
+        if self._is_loading and self._cached_data is not None:
+            self.reload()
+            self.show()
         super().iterate_loop()
 
     def handle_btn_press(self, button_number):
@@ -1,10 +1,12 @@
+import hashlib
 import logging
 import os
-from PIL import Image
+from PIL import Image, ImageDraw
 
 import settings
 from libs.tailscale import get_tailscale
 from screens import AbstractScreen
+from screens._fontcache import get_font
 
 # Get project root for image paths
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -18,52 +20,80 @@ class Screen(AbstractScreen):
     """
     tailscale = get_tailscale()
     reload_interval = 30  # Refresh every 30 seconds
+    _last_fingerprint: bytes = None  # Hash of the last rendered content
+
+    @classmethod
+    def _icon(cls):
+        """Tailscale logo, decoded and resized once per process"""
+        if not hasattr(cls, '_icon_img'):
+            icon_path = os.path.join(IMAGES_DIR, 'tailscale.png')
+            try:
+                cls._icon_img = Image.open(icon_path).convert('L').resize((55, 55)).convert('1')
+            except FileNotFoundError:
+                logging.warning(f"Tailscale icon not found at {icon_path}")
+                cls._icon_img = None
+        return cls._icon_img
 
     def reload(self):
         # Invalidate cache to get fresh data
         self.tailscale.invalidate_cache()
 
+        # Gather everything visible first; if nothing changed since the
+        # last render, skip the whole draw (and the e-paper refresh that
+        # would follow it)
+        connected = self.tailscale.is_connected
+        local_ip = self.tailscale.local_ip
+        ts_ip = self.tailscale.tailscale_ip
+        exit_status = self.tailscale.exit_node_status
+        peers_count = self.tailscale.peers_online
+        peer_names = self.tailscale.peer_names
+
+        fingerprint = hashlib.blake2b(
+            repr((connected, local_ip, ts_ip, exit_status,
+                  peers_count, tuple(peer_names))).encode(),
+            digest_size=16
+        ).digest()
+        if fingerprint == self._last_fingerprint and self.image:
+            return
+        self._last_fingerprint = fingerprint
+
         self.blank()
         self.draw_titlebar("Tailscale")
 
         # LEFT: Tailscale icon (top-left, 55x55, aligned with peers)
-        try:
-            icon_path = os.path.join(IMAGES_DIR, 'tailscale.png')
-            icon = Image.open(icon_path)
-            icon = icon.resize((55, 55))
+        icon = self._icon()
+        if icon:
             self.image.paste(icon, (1, 25))
-        except FileNotFoundError:
-            logging.warning(f"Tailscale icon not found at {icon_path}")
 
-        # RIGHT: Build the status string (larger font: 13pt)
-        string = ''
+        # RIGHT: Build the status string (larger font: 13pt), collected in
+        # a list and joined once instead of repeated concatenation
+        lines = []
 
         # Connection status
-        if self.tailscale.is_connected:
-            string += 'Status:    ✓ Connected\n'
+        if connected:
+            lines.append('Status:    ✓ Connected')
         else:
-            string += 'Status:    ✗ Disconnected\n'
+            lines.append('Status:    ✗ Disconnected')
 
         # Local IP
-        local_ip = self.tailscale.local_ip
         if local_ip:
-            string += f'Local:     {local_ip}\n'
+            lines.append(f'Local:     {local_ip}')
         else:
-            string += 'Local:     N/A\n'
+            lines.append('Local:     N/A')
 
         # Tailscale IP
-        ts_ip = self.tailscale.tailscale_ip
         if ts_ip:
-            string += f'Tailscale: {ts_ip}\n'
+            lines.append(f'Tailscale: {ts_ip}')
         else:
-            string += 'Tailscale: N/A\n'
+            lines.append('Tailscale: N/A')
 
         # Exit node status
-        exit_status = self.tailscale.exit_node_status
         if exit_status == "Available":
-            string += 'Exit Node: ✓ Available'
+            lines.append('Exit Node: ✓ Available')
         else:  # Disabled
-            string += 'Exit Node: - Disabled'
+            lines.append('Exit Node: - Disabled')
+
+        string = '\n'.join(lines)
 
         # Draw the status information (larger font, adjusted for bigger logo)
         self.text(string, font_size=13, font_name=settings.MONOSPACE_FONT, position=(66, 25), wrap=False)
@@ -72,17 +102,13 @@ class Screen(AbstractScreen):
         self.line((5, 95, self.display.get_size()[0] - 5, 95), width=1)
 
         # BOTTOM: Peers section
-        peers_count = self.tailscale.peers_online
         peers_header = f'Peers:     {peers_count} online'
         self.text(peers_header, font_size=13, font_name=settings.MONOSPACE_FONT, position=(5, 101), wrap=False)
 
         # Peer list (2 columns at 50% width each)
-        peer_names = self.tailscale.peer_names
         if peer_names:
-            col1_x = 8
-            col2_x = 140  # Roughly 50% of 264px width for better spacing
+            col_xs = (8, 140)  # Second column roughly 50% of 264px width
             peer_y = 120
-            col_height = 10
             peers_per_col = 5  # 5 peers per column (10 total max)
 
             # Limit to 9 peers + "more" indicator if there are more than 10
@@ -90,17 +116,16 @@ class Screen(AbstractScreen):
             if len(peer_names) > 10:
                 display_peers.append(f'+{len(peer_names) - 9} more...')
 
-            for idx, peer in enumerate(display_peers):
-                col = idx // peers_per_col
-                row = idx % peers_per_col
-
-                if col == 0:
-                    x = col1_x
-                else:
-                    x = col2_x
-
-                y = peer_y + row * col_height
-                self.text(f'• {peer}', font_size=10, position=(x, y), wrap=False)
+            # One multiline draw per column instead of a text() call per peer
+            draw = ImageDraw.Draw(self.image)
+            font = get_font(settings.FONT, 10)
+            for col, col_x in enumerate(col_xs):
+                chunk = display_peers[col * peers_per_col:(col + 1) * peers_per_col]
+                if not chunk:
+                    break
+                block = '\n'.join(f'• {peer}' for peer in chunk)
+                draw.multiline_text((col_x, peer_y), block, font=font,
+                                    fill=0, spacing=0)
 
     def iterate_loop(self):
         """
@@ -1,20 +1,56 @@
 import logging
-from PIL import ImageFont
+import time
+
 import settings
 
-from libs.weather import Weather, get_weather, update_weather
+from libs.weather import Weather, format_temperature, get_weather, update_weather
 from screens import AbstractScreen
+from screens._fontcache import get_font, get_text_bbox, get_text_width
+
+# Warm the shared font cache for the sizes this screen draws with, so the
+# first reload doesn't pay the freetype parse on the render path
+for _size in (15, 18, 32):
+    get_font(settings.BOLD_FONT, _size)
+get_font(settings.FONT, 20)
+del _size
 
 
 class Screen(AbstractScreen):
 
     weather: Weather = get_weather()
 
+    # Manual refreshes within this window are coalesced so button mashing
+    # can't hammer the Met.no API ahead of its normal cadence
+    _MIN_REFRESH = 60  # seconds
+    _last_refresh = 0.0
+
+    def __init__(self):
+        super().__init__()
+        # Static layout, derived once from the fixed display geometry
+        # instead of being recomputed on every reload
+        width, height = self.display.get_size()
+        self._width = width
+        self._icon_size = 70
+        self._gap_between = 8  # Gap between icon and temperature
+        available_height = height - 30  # Account for titlebar
+        # Center in upper portion, raised 10px
+        self._block_y = (available_height - self._icon_size) // 3 + 30 - 10
+        self._last_sig = None  # Signature of the last rendered content
+        self._range_key = ()  # (min, max) behind the cached range string
+        self._range_text = ""
+
     def handle_btn_press(self, button_number: int = 1):
         if button_number == 0:
             pass
         elif button_number == 1:
-            update_weather()
+            # update_weather is a wake signal to the weather thread, so
+            # the press never blocks on the network; the redraw below uses
+            # whatever snapshot is current and the fresh one lands on the
+            # next periodic reload
+            now = time.monotonic()
+            if now - Screen._last_refresh > self._MIN_REFRESH:
+                Screen._last_refresh = now
+                update_weather()
             self.reload()
             self.show()
         elif button_number == 2:
@@ -25,47 +61,63 @@ class Screen(AbstractScreen):
             logging.error("Unknown button pressed: KEY{}".format(button_number + 1))
 
     def reload(self):
+        # Everything this screen shows derives from these values; if they
+        # match the previous render the whole layout pass is a no-op
+        # (EPD.show additionally skips identical framebuffers, but this
+        # saves the draw work itself)
+        sig = (self.weather.get_temperature(),
+               self.weather.metno.get_temperature_range(),
+               self.weather.get_sky_text(),
+               self.weather.get_location_name())
+        if sig == self._last_sig and self.image is not None:
+            return
+        self._last_sig = sig
+
         self.blank()
 
         self.draw_titlebar("Weather")
 
         if self.weather.weather_data:
-            # Calculate centered block of icon + temperature
-            icon_size = 70
-            gap_between = 8  # Gap between icon and temperature
+            # Centered block of icon + temperature; geometry comes from the
+            # precomputed layout, font paths pulled into locals once
+            width = self._width
+            icon_size = self._icon_size
+            gap_between = self._gap_between
+            bold_font = settings.BOLD_FONT
+            regular_font = settings.FONT
 
             # Get current temperature and range separately
             temp_current = self.weather.get_temperature()
-            temp_current_text = f"{int(round(temp_current))}°" if temp_current != "--" else "--"
+            temp_current_text = format_temperature(temp_current)
 
-            # Get min/max range with arrows (reduced by 60% total - 30% twice)
+            # Get min/max range with arrows (reduced by 60% total - 30% twice);
+            # the formatted string is cached per (min, max) pair
             temp_min, temp_max = self.weather.metno.get_temperature_range()
-            if temp_min is not None and temp_max is not None:
-                temp_range_text = f"(↑{int(round(temp_max))}°↓{int(round(temp_min))}°)"
-            else:
-                temp_range_text = ""
-
-            # Calculate widths for layout
-            temp_current_font = ImageFont.truetype(settings.BOLD_FONT, 32)
-            temp_current_bbox = temp_current_font.getbbox(temp_current_text)
+            if (temp_min, temp_max) != self._range_key:
+                self._range_key = (temp_min, temp_max)
+                if temp_min is not None and temp_max is not None:
+                    self._range_text = f"(↑{int(round(temp_max))}°↓{int(round(temp_min))}°)"
+                else:
+                    self._range_text = ""
+            temp_range_text = self._range_text
+
+            # Calculate widths for layout (bbox lookups are memoized, so
+            # unchanged strings skip freetype shaping entirely)
+            temp_current_bbox = get_text_bbox(bold_font, 32, temp_current_text)
             temp_current_width = temp_current_bbox[2] - temp_current_bbox[0]
             temp_current_height = temp_current_bbox[3] - temp_current_bbox[1]
 
-            temp_range_font = ImageFont.truetype(settings.BOLD_FONT, 15)  # 60% smaller total
-            temp_range_bbox = temp_range_font.getbbox(temp_range_text)
+            temp_range_bbox = get_text_bbox(bold_font, 15, temp_range_text)
             temp_range_width = temp_range_bbox[2] - temp_range_bbox[0]
             temp_range_height = temp_range_bbox[3] - temp_range_bbox[1]
 
             # Calculate total width of icon + gap + current temp + range
             total_width = icon_size + gap_between + temp_current_width + temp_range_width
 
-            # Center the entire block horizontally and vertically
-            block_x = (self.image.size[0] - total_width) // 2
-
-            # Calculate vertical centering (between titlebar and description)
-            available_height = self.image.size[1] - 30  # Account for titlebar
-            block_height = icon_size
-            block_y = (available_height - block_height) // 3 + 30 - 10  # Center in upper portion, raised 10px
+            # Center the entire block horizontally; the vertical position
+            # was fixed at init time
+            block_x = (width - total_width) // 2
+            block_y = self._block_y
 
             # Weather icon (left side of block)
             icon_x = block_x
@@ -78,36 +130,37 @@ class Screen(AbstractScreen):
             # Align with icon, with slight offset to compensate SVG internal margin
             temp_current_x = icon_x + icon_size + gap_between
             temp_current_y = icon_y + (icon_size - temp_current_height) // 2 - 4  # Raised 4px for SVG margin
-            self.text(temp_current_text, font_size=32, position=(temp_current_x, temp_current_y),
-                     font_name=settings.BOLD_FONT)
-
-            # Min/max range (right of current temp, BOLD, smaller - 60% reduction total)
-            # Aligned to same baseline as current temp
-            if temp_range_text:
-                temp_range_x = temp_current_x + temp_current_width
-                # Baseline alignment: align bottom of bboxes (approximates baseline alignment)
-                temp_range_y = temp_current_y + (temp_current_height - temp_range_height)
-                self.text(temp_range_text, font_size=15, position=(temp_range_x, temp_range_y),
-                         font_name=settings.BOLD_FONT)
 
             # Weather description (regular, centered below icon+temp)
             desc_text = str(self.weather.get_sky_text())
-            desc_font = ImageFont.truetype(settings.FONT, 20)
-            desc_bbox = desc_font.getbbox(desc_text)
-            desc_width = desc_bbox[2] - desc_bbox[0]
-            desc_x = (self.image.size[0] - desc_width) // 2
+            desc_width = get_text_width(regular_font, 20, desc_text)
+            desc_x = (width - desc_width) // 2
             desc_y = icon_y + icon_size + 8  # Reduced gap from 15 to 8
-            self.text(desc_text, font_size=20, position=(desc_x, desc_y))
 
             # Location (BOLD, centered below description)
             location_text = str(self.weather.get_location_name())
-            location_font = ImageFont.truetype(settings.BOLD_FONT, 18)
-            location_bbox = location_font.getbbox(location_text)
-            location_width = location_bbox[2] - location_bbox[0]
-            location_x = (self.image.size[0] - location_width) // 2
+            location_width = get_text_width(bold_font, 18, location_text)
+            location_x = (width - location_width) // 2
             location_y = desc_y + 24  # Reduced gap from 28 to 24
-            self.text(location_text, font_size=18, position=(location_x, location_y),
-                     font_name=settings.BOLD_FONT)
+
+            # All fragments are single-line and pre-positioned, so they go
+            # out through one ImageDraw handle instead of a text() call
+            # (with its wrap machinery) per string
+            entries = [
+                (temp_current_text, (temp_current_x, temp_current_y), bold_font, 32),
+                (desc_text, (desc_x, desc_y), regular_font, 20),
+                (location_text, (location_x, location_y), bold_font, 18),
+            ]
+
+            # Min/max range (right of current temp, BOLD, smaller - 60% reduction total)
+            # Aligned to same baseline as current temp
+            if temp_range_text:
+                temp_range_x = temp_current_x + temp_current_width
+                # Baseline alignment: align bottom of bboxes (approximates baseline alignment)
+                temp_range_y = temp_current_y + (temp_current_height - temp_range_height)
+                entries.append((temp_range_text, (temp_range_x, temp_range_y), bold_font, 15))
+
+            self.text_batch(entries)
 
         else:
             self.centered_text("No data", 105, 30)
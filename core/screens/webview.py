@@ -1,3 +1,4 @@
+import queue
 import threading
 import logging
 import os
@@ -11,6 +12,12 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 CACHE_DIR = os.path.join(PROJECT_ROOT, 'cache')
 WEBSHOT_PATH = os.path.join(CACHE_DIR, 'webshot.png')
 
+# Cap on the wkhtmltoimage canvas: its render time scales with area, and
+# pixels much past ~2x the display resolution are thrown away by the
+# downscale anyway. 1Mpx keeps text crisp at WEBVIEW_SCALE extremes
+# without letting small scale values balloon the render
+MAX_RENDER_PIXELS = 1_000_000
+
 
 class Screen(AbstractScreen):
     """
@@ -21,9 +28,36 @@ class Screen(AbstractScreen):
     _initialized = False
     _cached_screenshot = None
     _is_rendering = False
-    _render_thread = None
     reload_interval = settings.WEBVIEW_RELOAD_INTERVAL  # Override default reload interval
 
+    def __init__(self):
+        super().__init__()
+        # Warm WebShot at construction: the htmlwebshot import and the
+        # wkhtmltoimage binary discovery happen at daemon startup instead
+        # of on the first visit's render path
+        self._init_webshot()
+
+        # One persistent worker renders off a single-slot queue: refresh
+        # requests never allocate a thread, and a request arriving while
+        # one is already pending coalesces into it
+        self._render_queue = queue.Queue(maxsize=1)
+        threading.Thread(target=self._render_worker,
+                         name="WebviewRenderer", daemon=True).start()
+
+    def _render_worker(self):
+        """Consume render requests one at a time (worker thread)"""
+        while True:
+            self._render_queue.get()
+            self._render_webpage_async()
+
+    def _request_render(self):
+        """Queue a background render; drops the request if one is pending"""
+        try:
+            self._render_queue.put_nowait(True)
+            self._is_rendering = True
+        except queue.Full:
+            pass
+
     def _init_webshot(self):
         """Lazy initialization of WebShot"""
         if self._initialized:
@@ -70,6 +104,12 @@ class Screen(AbstractScreen):
             render_width = int(base_width / settings.WEBVIEW_SCALE)
             render_height = int(base_height / settings.WEBVIEW_SCALE)
 
+            # Clamp the requested area, preserving aspect ratio
+            if render_width * render_height > MAX_RENDER_PIXELS:
+                shrink = (MAX_RENDER_PIXELS / (render_width * render_height)) ** 0.5
+                render_width = int(render_width * shrink)
+                render_height = int(render_height * shrink)
+
             logging.info(f"Rendering in {settings.WEBVIEW_ORIENTATION} mode: {render_width}x{render_height}")
 
             # wkhtmltoimage expects (width, height)
@@ -116,8 +156,18 @@ class Screen(AbstractScreen):
             new_width = content_width
             new_height = int(screenshot.height * scale_to_width)
 
-            # Resize maintaining 16:9 aspect ratio
-            self._cached_screenshot = screenshot.resize((new_width, new_height), Image.LANCZOS)
+            # Resize maintaining aspect ratio. Grayscale first so the
+            # filter runs on one channel instead of three, and use a box
+            # reduction plus one bilinear pass (reducing_gap) instead of
+            # the full Lanczos convolution - indistinguishable once the
+            # e-paper dithers the result to 1-bit, and much cheaper on
+            # the Pi at these shrink ratios
+            # Dither to 1-bit here, once, so every subsequent paste of the
+            # cached screenshot is a plain blit instead of a per-pixel
+            # quantization against the 1-bit canvas
+            self._cached_screenshot = screenshot.convert('L').resize(
+                (new_width, new_height), Image.BILINEAR,
+                reducing_gap=2.0).convert('1')
 
             logging.info(f"Webpage render completed: {render_width}x{render_height} -> {content_width}x{content_height}")
 
@@ -125,8 +175,7 @@ class Screen(AbstractScreen):
             self.error_message = None
 
             # Force immediate display update to show the new screenshot
-            self.reload()
-            self.show()
+            self._fast_present()
         except Exception as e:
             logging.error(f"Error rendering webpage: {e}")
             # Don't overwrite error_message if it's a setup error (wkhtmltopdf not found, etc)
@@ -140,6 +189,17 @@ class Screen(AbstractScreen):
         finally:
             self._is_rendering = False
 
+    def _fast_present(self):
+        """
+        Paste the cached screenshot and show it, skipping the generic
+        reload path (which re-runs WebShot init and the state checks);
+        on success the screen content is just titlebar + screenshot
+        """
+        self.blank()
+        self.draw_titlebar("Web View")
+        self.image.paste(self._cached_screenshot, (0, 20))
+        self.show()
+
     def handle_btn_press(self, button_number: int = 1):
         """
         This method receives the button presses
@@ -185,9 +245,7 @@ class Screen(AbstractScreen):
                 self.text("This may take 1-2 minutes", font_size=12, position=(10, 80))
             else:
                 # First load - start background render
-                self._is_rendering = True
-                self._render_thread = threading.Thread(target=self._render_webpage_async, daemon=True)
-                self._render_thread.start()
+                self._request_render()
 
                 self.text("Loading webpage...", font_size=14, position=(10, 40))
                 self.text(f"URL: {settings.WEBVIEW_URL}", font_size=10, position=(10, 60))
@@ -203,10 +261,8 @@ class Screen(AbstractScreen):
             # Check if it's time for auto-refresh (handled by parent's iterate_loop)
             if self.reload_wait >= self.reload_interval:
                 logging.info("Auto-refresh triggered, starting background render")
-                self._is_rendering = True
                 self.reload_wait = 0  # Reset counter to prevent immediate re-trigger
-                self._render_thread = threading.Thread(target=self._render_webpage_async, daemon=True)
-                self._render_thread.start()
+                self._request_render()
 
         # This line is very important, it keeps the auto reload working
         super().iterate_loop()
@@ -1,4 +1,3 @@
-import tzlocal
 import sys
 import os
 
@@ -6,83 +5,32 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 try:
-    from local_settings import DRIVER
-except ImportError:
-    DRIVER = "epd2in7b"
-
-try:
-    from local_settings import DEBUG
-except ImportError:
-    DEBUG = False
-
-try:
-    from local_settings import SAVE_SCREENSHOTS
-except ImportError:
-    SAVE_SCREENSHOTS = False
-
-try:
-    from local_settings import LOGFILE
-except ImportError:
-    LOGFILE = None
-
-try:
-    from local_settings import PAGE_BUTTONS
-except ImportError:
-    PAGE_BUTTONS = True
-
-try:
-    from local_settings import LOGO
-except ImportError:
-    LOGO = None
-
-try:
-    from local_settings import FONT
-except ImportError:
-    FONT = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
-
-try:
-    from local_settings import BOLD_FONT
-except ImportError:
-    BOLD_FONT = '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf'
-
-try:
-    from local_settings import MONOSPACE_FONT
-except ImportError:
-    MONOSPACE_FONT = '/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf'
-
-try:
-    from local_settings import TIME
-except ImportError:
-    TIME = 900
-
-try:
-    from local_settings import CALENDAR_URLS
-except ImportError:
-    CALENDAR_URLS = []
-
-try:
-    from local_settings import CALENDAR_REFRESH
-except ImportError:
-    CALENDAR_REFRESH = 900
-
-try:
-    from local_settings import TIMEZONE
-except ImportError:
-    TIMEZONE = tzlocal.get_localzone().key
-
-try:
-    from local_settings import SCREENS
-except ImportError:
-    SCREENS = [
+    import local_settings
+except ImportError:
+    local_settings = None
+
+# Every setting with a static default, in one table: each name becomes a
+# module attribute, taken from local_settings when defined there. One
+# attribute lookup per setting instead of a caught ImportError each.
+DEFAULTS = {
+    'DRIVER': "epd2in7b",
+    'DEBUG': False,
+    'SAVE_SCREENSHOTS': False,
+    'LOGFILE': None,
+    'PAGE_BUTTONS': True,
+    'LOGO': None,
+    'FONT': '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+    'BOLD_FONT': '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
+    'MONOSPACE_FONT': '/usr/share/fonts/truetype/dejavu/DejaVuSansMono.ttf',
+    'TIME': 900,
+    'CALENDAR_URLS': [],
+    'CALENDAR_REFRESH': 900,
+    'SCREENS': [
         'system',
         'fortune',
         'affirmations',
-    ]
-
-try:
-    from local_settings import AFFIRMATIONS
-except ImportError:
-    AFFIRMATIONS = [
+    ],
+    'AFFIRMATIONS': [
         "You are enough",
         "You are loved",
         "You are safe",
@@ -91,65 +39,30 @@ except ImportError:
         "You are beautiful",
         "You are strong",
         "You have come a long way"
-    ]
-
-try:
-    from local_settings import WEATHER_CITY
-except ImportError:
-    WEATHER_CITY = "Richmond, VA"
-
-try:
-    from local_settings import WEATHER_REFRESH
-except ImportError:
-    WEATHER_REFRESH = 900
-
-try:
-    from local_settings import FORTUNE_PATH
-except ImportError:
-    FORTUNE_PATH = None
-
-try:
-    from local_settings import WEBVIEW_URL
-except ImportError:
-    WEBVIEW_URL = 'http://localhost:5000'
-
-try:
-    from local_settings import WEBVIEW_RELOAD_INTERVAL
-except ImportError:
-    WEBVIEW_RELOAD_INTERVAL = 300
-
-try:
-    from local_settings import WEBVIEW_SCALE
-except ImportError:
-    WEBVIEW_SCALE = 0.5
-
-try:
-    from local_settings import WEBVIEW_ORIENTATION
-except ImportError:
-    WEBVIEW_ORIENTATION = 'landscape'
-
-try:
-    from local_settings import NETWORK_INTERFACE
-except ImportError:
-    NETWORK_INTERFACE = 'eth0'
-
-# Web Interface Configuration
-try:
-    from local_settings import SECRET_KEY
-except ImportError:
-    SECRET_KEY = b'change-me-insecure-default'
-
-try:
-    from local_settings import AUTH_USERNAME
-except ImportError:
-    AUTH_USERNAME = 'admin'
-
-try:
-    from local_settings import AUTH_PASSWORD
-except ImportError:
-    AUTH_PASSWORD = 'changeme'
-
-try:
-    from local_settings import FEEDS
-except ImportError:
-    FEEDS = []
+    ],
+    'WEATHER_CITY': "Richmond, VA",
+    'WEATHER_REFRESH': 900,
+    'FORTUNE_PATH': None,
+    'WEBVIEW_URL': 'http://localhost:5000',
+    'WEBVIEW_RELOAD_INTERVAL': 300,
+    'WEBVIEW_SCALE': 0.5,
+    'WEBVIEW_ORIENTATION': 'landscape',
+    'NETWORK_INTERFACE': 'eth0',
+    # Web Interface Configuration
+    'SECRET_KEY': b'change-me-insecure-default',
+    'AUTH_USERNAME': 'admin',
+    'AUTH_PASSWORD': 'changeme',
+    'FEEDS': [],
+}
+
+for _name, _default in DEFAULTS.items():
+    globals()[_name] = getattr(local_settings, _name, _default)
+del _name, _default
+
+# TIMEZONE is special-cased: its default needs a tzlocal lookup, and
+# tzlocal is only imported when that fallback is actually taken - it
+# stays off the import path of every module that just needs a font path
+TIMEZONE = getattr(local_settings, 'TIMEZONE', None)
+if TIMEZONE is None:
+    import tzlocal
+    TIMEZONE = tzlocal.get_localzone().key
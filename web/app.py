@@ -1,10 +1,16 @@
+import importlib
 import logging
 import posix_ipc
+import queue
 import re
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from flask import Flask, render_template, flash, redirect, request, Response, send_file, jsonify
+from flask import Flask, render_template, flash, redirect, request, Response, send_from_directory, jsonify
+from werkzeug.exceptions import NotFound
 import feedparser
 
 from system import System
@@ -21,13 +27,63 @@ except ImportError:
 app = Flask(__name__)
 app.config['SECRET_KEY'] = settings.SECRET_KEY
 
-# Disable caching for development
-app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
-app.config['TEMPLATES_AUTO_RELOAD'] = True
+# Paths used by the request handlers, resolved once at import
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SCREENS_DIR = os.path.join(_BASE_DIR, 'core', 'screens')
+_DISPLAY_DIR = os.path.join(_BASE_DIR, 'core', 'display')
+_CURRENT_SCREEN_FILE = os.path.join(_DISPLAY_DIR, 'current_screen.txt')
+_SETTINGS_FILE = os.path.join(_BASE_DIR, 'local_settings.py')
+
+# Patterns used on every request, compiled once at import
+_SCREEN_NAME_RE = re.compile(r'^[a-zA-Z0-9_.-]+$')
+_HTML_TAG_RE = re.compile(r'<[^<]+?>')
+
+# lxml strips summary HTML in C and handles entities/CDATA correctly;
+# optional, the regex above is the fallback
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+
+def _strip_html(markup):
+    """Reduce an HTML fragment to its text content"""
+    if lxml_html is not None:
+        try:
+            return lxml_html.fragment_fromstring(markup, create_parent=True).text_content()
+        except Exception:
+            pass
+    # Simple HTML tag removal
+    return _HTML_TAG_RE.sub('', markup)
+
+if settings.DEBUG:
+    # Disable caching for development
+    app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
+    app.config['TEMPLATES_AUTO_RELOAD'] = True
+else:
+    # Templates only change with a deploy: skip the per-request template
+    # stat/recompile and keep compiled bytecode on disk (cache/ is
+    # gitignored), so warm renders go straight to execution
+    from jinja2 import FileSystemBytecodeCache
+    _jinja_cache_dir = os.path.join(os.path.dirname(__file__), '..', 'cache', 'jinja')
+    os.makedirs(_jinja_cache_dir, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(_jinja_cache_dir)
+
+    # Minify templates once at load time; per-render cost is zero and the
+    # pages ship smaller. Optional - plain templates work fine without it
+    try:
+        from jinja2_htmlmin import minify_loader
+        app.jinja_loader = minify_loader(app.jinja_loader,
+                                         remove_comments=True,
+                                         remove_empty_space=True)
+    except ImportError:
+        pass
 
 @app.after_request
 def add_no_cache_headers(response):
-    """Add no-cache headers to all responses"""
+    """Add no-cache headers to all responses (screenshots manage their own)"""
+    if request.path.startswith('/display_screenshot/'):
+        return response
     response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
     response.headers['Pragma'] = 'no-cache'
     response.headers['Expires'] = '0'
@@ -39,58 +95,108 @@ except posix_ipc.PermissionsError:
     logging.error("couldn't open message queue")
     exit(1)
 
+# All IPC sends go through one writer thread: request handlers enqueue
+# and return immediately instead of blocking on mq_send
+_ipc_queue = queue.Queue(maxsize=256)
+
+# Only idempotent commands may coalesce - next/previous/buttonN each
+# carry meaning per repetition (mirrors IDEMPOTENT_COMMANDS in core/app.py)
+_IPC_IDEMPOTENT = ("reload", "screen ")
+
+
+def _ipc_worker():
+    last_message = None
+    while True:
+        message = _ipc_queue.get()
+        if (message == last_message and not _ipc_queue.empty()
+                and message.startswith(_IPC_IDEMPOTENT)):
+            # Drop exact repeats of idempotent commands while more wait
+            continue
+        last_message = message
+        try:
+            mq.send(message, timeout=10)
+        except Exception as e:
+            logging.error(f"Failed to send IPC message '{message}': {e}")
+
+
+threading.Thread(target=_ipc_worker, daemon=True).start()
+
+
+def send_ipc(message):
+    """Hand a command to the IPC writer thread (never blocks the request)"""
+    try:
+        _ipc_queue.put_nowait(message)
+    except queue.Full:
+        logging.warning(f"IPC queue full, dropping '{message}'")
+
+
+# Both lookups below run on every GET /; the underlying directory and
+# settings file change rarely, so the parsed results are cached and only
+# rebuilt when the source's mtime moves
+_available_screens_cache = {"mtime": None, "data": []}
+_active_screens_cache = {"mtime": None, "data": []}
+
 
 # Get available screens from core/screens directory
 def get_available_screens():
     """
     Read all available screen modules from ../core/screens/ directory.
     Returns a sorted list of screen names (without .py extension).
+    Cached until the directory mtime changes.
     """
-    screens_dir = os.path.join(os.path.dirname(__file__), '..', 'core', 'screens')
     available_screens = []
 
     try:
-        if os.path.isdir(screens_dir):
-            for filename in os.listdir(screens_dir):
+        mtime = os.stat(_SCREENS_DIR).st_mtime_ns
+        if mtime == _available_screens_cache["mtime"]:
+            return _available_screens_cache["data"]
+
+        # scandir keeps the DirEntry data from the single readdir pass
+        with os.scandir(_SCREENS_DIR) as entries:
+            for entry in entries:
+                name = entry.name
                 # Only include .py files, exclude hidden files, __init__.py and private modules
-                if (filename.endswith('.py') and
-                    not filename.startswith('_') and
-                    not filename.startswith('.')):
-                    screen_name = filename[:-3]  # Remove .py extension
-                    available_screens.append(screen_name)
+                if name.endswith('.py') and not name.startswith(('_', '.')):
+                    available_screens.append(name[:-3])  # Remove .py extension
     except (OSError, IOError) as e:
         logging.warning(f"Could not read screens directory: {e}")
+        _available_screens_cache.update(mtime=None, data=[])
+        return []
 
-    return sorted(available_screens)
+    available_screens.sort()
+    _available_screens_cache.update(mtime=mtime, data=available_screens)
+    return available_screens
 
 
 # Get active screens from local_settings.py
 def get_active_screens():
     """
-    Read active screen list from ../local_settings.py (project root).
-    Parses the SCREENS list from the settings file.
+    Read the active screen list from ../local_settings.py (project root).
+    The file is imported as a module (settings.py already put the project
+    root on sys.path) instead of being regex-parsed, so comments,
+    formatting and any Python expression in SCREENS are handled
+    correctly. Reloaded only when the file's mtime changes.
     Returns a list of currently active screen names.
     """
-    settings_file = os.path.join(os.path.dirname(__file__), '..', 'local_settings.py')
-    active_screens = []
+    try:
+        mtime = os.stat(_SETTINGS_FILE).st_mtime_ns
+    except OSError:
+        # No local_settings.py: show the defaults the daemon falls back to
+        return list(getattr(settings, 'SCREENS', []))
+
+    if mtime == _active_screens_cache["mtime"]:
+        return _active_screens_cache["data"]
 
     try:
-        with open(settings_file, 'r') as f:
-            content = f.read()
-
-        # Find SCREENS = [...] in the file
-        # Use regex to extract the list
-        match = re.search(r'SCREENS\s*=\s*\[(.*?)\]', content, re.DOTALL)
-        if match:
-            screens_text = match.group(1)
-            # Extract quoted strings (screen names)
-            screen_names = re.findall(r'[\'"]([^\'"]+)[\'"]', screens_text)
-            active_screens = screen_names
-    except (OSError, IOError) as e:
-        logging.warning(f"Could not read local_settings.py: {e}")
+        import local_settings
+        importlib.reload(local_settings)
+        active_screens = list(getattr(local_settings, 'SCREENS', settings.SCREENS))
     except Exception as e:
-        logging.warning(f"Could not parse SCREENS from local_settings.py: {e}")
+        logging.warning(f"Could not load SCREENS from local_settings.py: {e}")
+        _active_screens_cache.update(mtime=None, data=[])
+        return []
 
+    _active_screens_cache.update(mtime=mtime, data=active_screens)
     return active_screens
 
 
@@ -103,7 +209,7 @@ def validate_screen_name(screen_name):
     if not screen_name:
         return None
     # Allow only safe characters: letters, numbers, underscore, hyphen, dot
-    if not re.match(r'^[a-zA-Z0-9_.-]+$', screen_name):
+    if not _SCREEN_NAME_RE.match(screen_name):
         return None
     # Limit length
     if len(screen_name) > 100:
@@ -117,7 +223,9 @@ def index():
     active_screens = get_active_screens()
 
     # Filter available screens to show only those not yet active
-    inactive_screens = [screen for screen in available_screens if screen not in active_screens]
+    # (set membership instead of a list scan per screen)
+    active_set = frozenset(active_screens)
+    inactive_screens = [screen for screen in available_screens if screen not in active_set]
 
     return render_template('index.html', system=System,
                          available_screens=inactive_screens,
@@ -126,49 +234,30 @@ def index():
 
 @app.route('/next_screen')
 def next_screen():
-    mq.send("next", timeout=10)
+    send_ipc("next")
     flash("Sent 'next' message to paperGate")
     return redirect('/')
 
 
 @app.route('/previous_screen')
 def previous_screen():
-    mq.send("previous", timeout=10)
+    send_ipc("previous")
     flash("Sent 'previous' message to paperGate")
     return redirect('/')
 
 
-@app.route('/button0')
-def button0():
-    mq.send("button0", timeout=10)
-    flash("Sent 'KEY1' message to paperGate")
-    return redirect('/')
-
-
-@app.route('/button1')
-def button1():
-    mq.send("button1", timeout=10)
-    flash("Sent 'KEY2' message to paperGate")
-    return redirect('/')
-
-
-@app.route('/button2')
-def button2():
-    mq.send("button2", timeout=10)
-    flash("Sent 'KEY3' message to paperGate")
-    return redirect('/')
-
-
-@app.route('/button3')
-def button3():
-    mq.send("button3", timeout=10)
-    flash("Sent 'KEY4' message to paperGate")
+@app.route('/button<int:number>')
+def button(number):
+    if not 0 <= number <= 3:
+        return "Invalid button number", 400
+    send_ipc(f"button{number}")
+    flash(f"Sent 'KEY{number + 1}' message to paperGate")
     return redirect('/')
 
 
 @app.route('/reload')
 def reload():
-    mq.send("reload", timeout=10)
+    send_ipc("reload")
     flash("Sent 'reload' message to paperGate")
     return redirect('/')
 
@@ -180,7 +269,7 @@ def screen():
     if not screen_name:
         flash("Invalid screen name. Only alphanumeric, underscore, hyphen, and dot allowed.", "error")
         return redirect('/')
-    mq.send("screen " + screen_name, timeout=10)
+    send_ipc("screen " + screen_name)
     flash("Sent 'screen' message to paperGate")
     return redirect('/')
 
@@ -194,7 +283,7 @@ def add_screen():
         return redirect('/')
 
     # Send IPC message to daemon (session-only, not persistent)
-    mq.send("add_screen " + screen_name, timeout=10)
+    send_ipc("add_screen " + screen_name)
     flash(f"Added '{screen_name}' screen (session only - resets on reboot)", "success")
 
     return redirect('/')
@@ -209,7 +298,7 @@ def remove_screen():
         return redirect('/')
 
     # Send IPC message to daemon (session-only, not persistent)
-    mq.send("remove_screen " + screen_name, timeout=10)
+    send_ipc("remove_screen " + screen_name)
     flash(f"Removed '{screen_name}' screen (restored on reboot)", "success")
 
     return redirect('/')
@@ -223,26 +312,25 @@ def display_screenshot(screen_name):
     if not screen_name:
         return "Invalid screen name", 400
 
-    screenshot_path = os.path.join(
-        os.path.dirname(__file__),
-        '..',
-        'core',
-        'display',
-        f'{screen_name}.png'
-    )
-
-    if not os.path.exists(screenshot_path):
+    # Conditional send: the frontend polls this endpoint, but the PNG only
+    # changes when the screen redraws, so matching If-Modified-Since /
+    # If-None-Match requests come back as a bodyless 304. no-cache (not
+    # no-store) makes the browser revalidate every poll without ever
+    # showing a stale frame. send_from_directory hands the open file to
+    # the WSGI file wrapper, so the server can push the bytes with
+    # sendfile instead of a Python read loop (and a reverse proxy can
+    # alias core/display/ to bypass Flask entirely - see
+    # docs/reverse-proxy.md).
+    try:
+        response = send_from_directory(
+            _DISPLAY_DIR,
+            f'{screen_name}.png',
+            mimetype='image/png',
+            conditional=True
+        )
+    except NotFound:
         return f"Screenshot for '{screen_name}' not available", 404
-
-    # Return image with no-cache headers
-    response = send_file(
-        screenshot_path,
-        mimetype='image/png',
-        max_age=0
-    )
-    response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-    response.headers['Pragma'] = 'no-cache'
-    response.headers['Expires'] = '0'
+    response.headers['Cache-Control'] = 'no-cache'
 
     return response
 
@@ -250,16 +338,8 @@ def display_screenshot(screen_name):
 @app.route('/current_screen_name')
 def current_screen_name():
     """Return the name of the currently displayed screen."""
-    current_screen_file = os.path.join(
-        os.path.dirname(__file__),
-        '..',
-        'core',
-        'display',
-        'current_screen.txt'
-    )
-
     try:
-        with open(current_screen_file, 'r') as f:
+        with open(_CURRENT_SCREEN_FILE, 'r') as f:
             screen_name = f.read().strip()
         return jsonify({'screen': screen_name}), 200
     except FileNotFoundError:
@@ -268,40 +348,82 @@ def current_screen_name():
         return jsonify({'error': str(e)}), 500
 
 
+# Fetched articles, reused across requests for _FEED_TTL seconds: the
+# webview screen polls /feed on its own refresh cycle and feeds change
+# at most every few minutes, so most hits can skip the network entirely
+_FEED_TTL = 120  # seconds
+_feed_cache = {"ts": 0.0, "articles": []}
+
+# Per-URL conditional-GET state: when the TTL cache does expire, feeds
+# that haven't changed upstream answer 304 and we reuse the last parse
+# instead of re-downloading and re-parsing the XML
+_feed_state = {}
+
+
+def _fetch_feed(url):
+    """Fetch one feed, using ETag/Last-Modified from the previous fetch"""
+    state = _feed_state.get(url)
+    kwargs = {}
+    if state:
+        if state.get('etag'):
+            kwargs['etag'] = state['etag']
+        if state.get('modified'):
+            kwargs['modified'] = state['modified']
+    feed = feedparser.parse(url, **kwargs)
+    if getattr(feed, 'status', None) == 304 and state:
+        return state['parsed']
+    _feed_state[url] = {
+        'etag': getattr(feed, 'etag', None),
+        'modified': getattr(feed, 'modified', None),
+        'parsed': feed,
+    }
+    return feed
+
+
 @app.route('/feed')
 def feed_index():
     """RSS feed reader page - integrated from epdtext-feed"""
-    articles = []
+    now = time.monotonic()
+    if now - _feed_cache["ts"] < _FEED_TTL:
+        return render_template('feed.html', articles=_feed_cache["articles"],
+                               last_update=datetime.now())
 
-    for feed_url in settings.FEEDS:
-        try:
-            feed = feedparser.parse(feed_url)
-            for entry in feed.entries[:10]:  # Get first 10 entries per feed
-                # Extract time
-                time_str = ""
-                if hasattr(entry, 'published_parsed') and entry.published_parsed:
-                    dt = datetime(*entry.published_parsed[:6])
-                    time_str = dt.strftime("%H:%M")
-
-                # Extract summary (remove HTML tags)
-                summary = ""
-                if hasattr(entry, 'summary'):
-                    summary = entry.summary
-                    # Simple HTML tag removal
-                    summary = re.sub('<[^<]+?>', '', summary)
-
-                articles.append({
-                    'title': entry.title,
-                    'summary': summary,
-                    'published': time_str,
-                    'link': entry.link if hasattr(entry, 'link') else ''
-                })
-        except Exception as e:
-            logging.error(f"Failed to fetch feed {feed_url}: {e}")
+    articles = []
+    feeds = settings.FEEDS
+
+    # Fetch all feeds concurrently: the loop is network-bound, so total
+    # latency becomes the slowest feed instead of the sum of all of them
+    with ThreadPoolExecutor(max_workers=min(8, len(feeds) or 1)) as executor:
+        futures = {executor.submit(_fetch_feed, url): url for url in feeds}
+        for future in as_completed(futures):
+            feed_url = futures[future]
+            try:
+                feed = future.result()
+                for entry in feed.entries[:10]:  # Get first 10 entries per feed
+                    # Extract time
+                    time_str = ""
+                    if hasattr(entry, 'published_parsed') and entry.published_parsed:
+                        dt = datetime(*entry.published_parsed[:6])
+                        time_str = dt.strftime("%H:%M")
+
+                    # Extract summary (remove HTML tags)
+                    summary = ""
+                    if hasattr(entry, 'summary'):
+                        summary = _strip_html(entry.summary)
+
+                    articles.append({
+                        'title': entry.title,
+                        'summary': summary,
+                        'published': time_str,
+                        'link': entry.link if hasattr(entry, 'link') else ''
+                    })
+            except Exception as e:
+                logging.error(f"Failed to fetch feed {feed_url}: {e}")
 
     # Sort by time (most recent first)
     articles.sort(key=lambda x: x.get('published', ''), reverse=True)
 
+    _feed_cache.update(ts=now, articles=articles)
     return render_template('feed.html', articles=articles, last_update=datetime.now())
 
 
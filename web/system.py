@@ -1,7 +1,10 @@
 import datetime
 import logging
 import platform
+import struct
 import time
+from functools import lru_cache
+from socket import AF_INET
 
 import humanize
 import distro
@@ -11,11 +14,30 @@ import psutil
 NETWORK_INTERFACE = "wlan0"
 logger = logging.getLogger('epdtext.libs.system')
 
+# The index page reads counters and addresses several times per render;
+# one /proc/net scan per second is plenty, so share it across methods
+_NET_TTL = 1.0  # seconds
+_net_cache = {"ts": 0.0, "io": None, "addrs": None}
+
+
+def _get_net_cache():
+    """Get the shared psutil network snapshot, refreshed at most once per TTL"""
+    now = time.monotonic()
+    if now - _net_cache["ts"] >= _NET_TTL:
+        _net_cache["io"] = psutil.net_io_counters()
+        _net_cache["addrs"] = psutil.net_if_addrs()
+        _net_cache["ts"] = now
+    return _net_cache
+
 
 class System:
     """
     This class provides access to system information
     """
+    # Humanized uptime only changes on a human timescale; re-render the
+    # string at most every 30s instead of per request
+    _uptime_cache = {"ts": 0.0, "val": ""}
+
     @staticmethod
     def get_size(data, suffix="B"):
         """
@@ -37,68 +59,87 @@ class System:
     def temperature():
         return round(psutil.sensors_temperatures()['cpu_thermal'][0].current)
 
+    # The identity methods below never change for the process lifetime,
+    # but the index template calls them per render; cache each result
     @staticmethod
+    @lru_cache(maxsize=1)
     def model():
         with open('/sys/firmware/devicetree/base/model', 'r') as model_file:
             return model_file.read()
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def system():
         return platform.system()
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def dist():
         return "{0} {1}".format(distro.name(), distro.version())
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def machine():
         return platform.machine()
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def node():
         return platform.node()
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def arch():
-        return platform.architecture()[0]
+        # Pointer size tells the word width directly;
+        # platform.architecture() can shell out to /usr/bin/file
+        return f"{struct.calcsize('P') * 8}bit"
 
     @staticmethod
     def uptime():
-        return humanize.naturaldelta(datetime.timedelta(seconds=time.clock_gettime(time.CLOCK_BOOTTIME)))
+        cache = System._uptime_cache
+        now = time.monotonic()
+        if now - cache["ts"] > 30 or not cache["val"]:
+            cache["val"] = humanize.naturaldelta(
+                datetime.timedelta(seconds=time.clock_gettime(time.CLOCK_BOOTTIME)))
+            cache["ts"] = now
+        return cache["val"]
 
     @staticmethod
     def network_total_sent():
-        net_io = psutil.net_io_counters()
+        net_io = _get_net_cache()["io"]
         return System.get_size(net_io.bytes_sent)
 
     @staticmethod
     def network_total_received():
-        net_io = psutil.net_io_counters()
+        net_io = _get_net_cache()["io"]
         return System.get_size(net_io.bytes_recv)
 
     @staticmethod
     def local_ipv4_address():
-        # First try the configured interface
-        for interface_name, interface_addresses in psutil.net_if_addrs().items():
-            for address in interface_addresses:
-                if interface_name == NETWORK_INTERFACE:
-                    if str(address.family) == 'AddressFamily.AF_INET':
-                        return address.address
-
-        # Fallback: auto-detect active interface (eth0, wlan0, etc.)
-        # Skip loopback and look for first non-localhost IPv4
-        for interface_name, interface_addresses in psutil.net_if_addrs().items():
-            # Skip loopback
+        """
+        Get the primary local IPv4 address. Single pass over the cached
+        interface table: the configured interface returns immediately,
+        and the first non-loopback candidate seen is kept as fallback,
+        so no address object is visited twice.
+        :return: str IP address, or None when offline
+        """
+        # One pass over the cached interface table: remember the first
+        # usable fallback while looking for the configured interface
+        fallback = None
+        for interface_name, interface_addresses in _get_net_cache()["addrs"].items():
             if interface_name.startswith('lo'):
                 continue
             for address in interface_addresses:
-                if str(address.family) == 'AddressFamily.AF_INET':
-                    ip = address.address
+                # Plain int compare; stringifying the enum allocates per
+                # address pair
+                if address.family == AF_INET:
+                    if interface_name == NETWORK_INTERFACE:
+                        return address.address
                     # Skip localhost addresses
-                    if not ip.startswith('127.'):
-                        return ip
+                    if fallback is None and not address.address.startswith('127.'):
+                        fallback = address.address
 
-        return None
+        return fallback
 
 
 if __name__ == '__main__':